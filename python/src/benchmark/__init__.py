@@ -1,6 +1,7 @@
 # Benchmark module
 from .metrics import GameMetrics, TurnMetrics, BenchmarkMetrics
 from .runner import GameRunner, BenchmarkRunner, RunnerConfig
+from .gamelog import GameLogWriter
 
 __all__ = [
     "GameMetrics",
@@ -9,4 +10,5 @@ __all__ = [
     "GameRunner",
     "BenchmarkRunner",
     "RunnerConfig",
+    "GameLogWriter",
 ]
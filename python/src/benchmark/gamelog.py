@@ -0,0 +1,109 @@
+"""Background JSONL writer for per-game benchmark records."""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from .. import jsonio
+
+
+class GameLogWriter:
+    """
+    Appends game records to a JSONL file from a background task.
+
+    Games hand their encoded line to a queue and continue immediately; a
+    single writer task coalesces the lines queued so far and writes and
+    flushes them off the event loop, so each finished game reaches the
+    file even if the run later crashes. The file is fsynced once, when
+    the log is closed.
+
+    Use as an async context manager:
+
+        async with GameLogWriter(path) as log:
+            await log.write(metrics.to_dict())
+    """
+
+    def __init__(self, path: Path, max_pending: int = 1024):
+        """
+        Initialize the writer.
+
+        Args:
+            path: JSONL file to append to (created if missing)
+            max_pending: Queued records before write() waits for the writer
+        """
+        self.path = Path(path)
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue[Optional[bytes]]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "GameLogWriter":
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._task = asyncio.create_task(self._drain())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._put(None)
+        if exc_type is not None:
+            # Still close the file, but don't mask the error leaving the body
+            await asyncio.gather(self._task, return_exceptions=True)
+            return
+        await self._task
+
+    async def write(self, record: dict) -> None:
+        """
+        Queue one record to be written as a JSON line.
+
+        Args:
+            record: JSON-serializable record
+        """
+        if not await self._put(jsonio.dumps(record) + b"\n"):
+            # Surface the writer's error instead of queueing into the void
+            await self._task
+            raise RuntimeError("Game log is already closed")
+
+    async def _put(self, item: Optional[bytes]) -> bool:
+        """Queue an item; False if the writer task exits before it's queued."""
+        if self._task.done():
+            return False
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return True
+
+        # Wait for room, but not on a writer that has died
+        put = asyncio.ensure_future(self._queue.put(item))
+        try:
+            await asyncio.wait((put, self._task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            queued = put.done()
+            if not queued:
+                put.cancel()
+        return queued
+
+    async def _drain(self) -> None:
+        """Write queued lines until the closing sentinel arrives."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.path, "ab") as f:
+            closing = False
+            while not closing:
+                buffer = bytearray()
+                line = await self._queue.get()
+                # Take whatever else is already queued along with it
+                while line is not None:
+                    buffer += line
+                    if self._queue.empty():
+                        break
+                    line = self._queue.get_nowait()
+                closing = line is None
+
+                if buffer:
+                    await asyncio.to_thread(_write_flushed, f, bytes(buffer))
+
+            await asyncio.to_thread(os.fsync, f.fileno())
+
+
+def _write_flushed(f: BinaryIO, data: bytes) -> None:
+    """Write data and hand it to the OS."""
+    f.write(data)
+    f.flush()
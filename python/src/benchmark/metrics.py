@@ -1,17 +1,21 @@
 """Metrics collection and analysis for benchmarking."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from statistics import NormalDist
 from typing import Optional
-import json
 from pathlib import Path
+import math
 import time
 
 import numpy as np
 
+from .. import jsonio
 from ..game import Team
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnMetrics:
     """Metrics for a single turn."""
     team: Team
@@ -28,7 +32,27 @@ class TurnMetrics:
     latency_ms: float = 0.0
 
 
-@dataclass
+# Turn fields serialized as-is, after the derived "team" and "clue" entries
+_TURN_FIELDS = (
+    "intended_targets",
+    "guesses_made",
+    "correct_guesses",
+    "hit_assassin",
+    "hit_opponent",
+    "turn_ended_by",
+)
+_turn_values = attrgetter("team", "clue_word", "clue_number", *_TURN_FIELDS)
+
+
+def _turn_to_dict(turn: TurnMetrics) -> dict:
+    """Convert a turn to its JSON form."""
+    team, clue_word, clue_number, *values = _turn_values(turn)
+    data = {"team": team.value, "clue": f"{clue_word} {clue_number}"}
+    data.update(zip(_TURN_FIELDS, values))
+    return data
+
+
+@dataclass(slots=True)
 class GameMetrics:
     """Metrics for a complete game."""
     board_id: str
@@ -45,21 +69,34 @@ class GameMetrics:
     total_tokens: int = 0
     total_latency_ms: float = 0.0
     game_duration_s: float = 0.0
+    # Per-turn columns of ``turns`` (built once; turns are final when recorded)
+    turn_correct: np.ndarray = field(init=False, repr=False, compare=False)
+    turn_hit_opponent: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        n = len(self.turns)
+        self.turn_correct = np.fromiter(
+            (t.correct_guesses for t in self.turns), dtype=np.int64, count=n
+        )
+        self.turn_hit_opponent = np.fromiter(
+            (t.hit_opponent for t in self.turns), dtype=np.bool_, count=n
+        )
 
     @property
     def red_won(self) -> bool:
-        return self.winner == Team.RED
+        return self.winner is Team.RED
 
     @property
     def blue_won(self) -> bool:
-        return self.winner == Team.BLUE
+        return self.winner is Team.BLUE
 
     @property
     def correct_per_clue(self) -> float:
         """Average correct guesses per clue."""
-        if not self.turns:
+        # Read the column, which outlives turns dropped after recording
+        if not len(self.turn_correct):
             return 0.0
-        return sum(t.correct_guesses for t in self.turns) / len(self.turns)
+        return float(self.turn_correct.mean())
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -78,85 +115,149 @@ class GameMetrics:
             "total_tokens": self.total_tokens,
             "total_latency_ms": self.total_latency_ms,
             "game_duration_s": self.game_duration_s,
-            "turns": [
-                {
-                    "team": t.team.value,
-                    "clue": f"{t.clue_word} {t.clue_number}",
-                    "intended_targets": t.intended_targets,
-                    "guesses_made": t.guesses_made,
-                    "correct_guesses": t.correct_guesses,
-                    "hit_assassin": t.hit_assassin,
-                    "hit_opponent": t.hit_opponent,
-                    "turn_ended_by": t.turn_ended_by,
-                }
-                for t in self.turns
-            ],
+            "turns": [_turn_to_dict(t) for t in self.turns],
         }
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _z_for(confidence: float) -> float:
+    """Two-sided normal critical value for a confidence level."""
+    return NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+
+
+@dataclass(slots=True)
+class _RunStats:
+    """Totals over a run's games, gathered in a single pass."""
+    games: int = 0
+    wins: int = 0
+    losses: int = 0
+    assassin_losses: int = 0
+    turns: int = 0  # Recorded turns (clues given)
+    opponent_hits: int = 0
+    correct_guesses: int = 0
+    game_turns: int = 0  # Sum of GameMetrics.total_turns
+    api_calls: int = 0
+    tokens: int = 0
+    win_rate_cis: dict[float, tuple[float, float]] = field(default_factory=dict)
+
+
+def _wilson_interval(wins: int, n: int, confidence: float) -> tuple[float, float]:
+    """Wilson score interval for a win rate of wins out of n games."""
+    if n == 0:
+        return (0.0, 0.0)
+
+    n_inv = 1.0 / n
+    p = wins * n_inv
+    z = _z_for(confidence)
+    z2 = z * z
+
+    denominator = 1 + z2 * n_inv
+    center = (p + 0.5 * z2 * n_inv) / denominator
+    spread = z * math.sqrt((p * (1 - p) + 0.25 * z2 * n_inv) * n_inv) / denominator
+
+    return (max(0, center - spread), min(1, center + spread))
+
+
+@dataclass(slots=True)
 class BenchmarkMetrics:
     """Aggregated metrics for a benchmark run."""
     config_name: str
     total_games: int
     games: list[GameMetrics] = field(default_factory=list)
+    _stats_cache: Optional[_RunStats] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _stats(self) -> _RunStats:
+        """
+        Get totals over all games.
+
+        Computed in one pass and reused until games are added or removed
+        (games are treated as immutable once recorded).
+        """
+        stats = self._stats_cache
+        if stats is not None and stats.games == len(self.games):
+            return stats
+
+        stats = _RunStats(games=len(self.games))
+        correct_cols = []
+        opponent_cols = []
+        for g in self.games:
+            if g.winner is Team.RED:
+                stats.wins += 1
+            elif g.winner is Team.BLUE:
+                stats.losses += 1
+            stats.assassin_losses += g.assassin_loss
+            correct_cols.append(g.turn_correct)
+            opponent_cols.append(g.turn_hit_opponent)
+            stats.game_turns += g.total_turns
+            stats.api_calls += g.total_api_calls
+            stats.tokens += g.total_tokens
+
+        if correct_cols:
+            correct = np.concatenate(correct_cols)
+            stats.turns = len(correct)
+            stats.correct_guesses = int(correct.sum())
+            stats.opponent_hits = int(np.count_nonzero(np.concatenate(opponent_cols)))
+
+        self._stats_cache = stats
+        return stats
 
     @property
     def wins(self) -> int:
         """Total wins (assuming we're tracking RED team as the test subject)."""
-        return sum(1 for g in self.games if g.red_won)
+        return self._stats().wins
 
     @property
     def losses(self) -> int:
-        return sum(1 for g in self.games if g.blue_won)
+        return self._stats().losses
 
     @property
     def win_rate(self) -> float:
-        if not self.games:
+        stats = self._stats()
+        if not stats.games:
             return 0.0
-        return self.wins / len(self.games)
+        return stats.wins / stats.games
 
     @property
     def assassin_loss_rate(self) -> float:
         """Rate of games lost by hitting the assassin."""
-        if not self.games:
+        stats = self._stats()
+        if not stats.games:
             return 0.0
-        assassin_losses = sum(1 for g in self.games if g.assassin_loss)
-        return assassin_losses / len(self.games)
+        return stats.assassin_losses / stats.games
 
     @property
     def opponent_flip_rate(self) -> float:
         """Average rate of revealing opponent words per turn."""
-        total_turns = sum(len(g.turns) for g in self.games)
-        if total_turns == 0:
+        stats = self._stats()
+        if stats.turns == 0:
             return 0.0
-        opponent_hits = sum(
-            1 for g in self.games for t in g.turns if t.hit_opponent
-        )
-        return opponent_hits / total_turns
+        return stats.opponent_hits / stats.turns
 
     @property
     def avg_correct_per_clue(self) -> float:
         """Average correct guesses per clue across all games."""
-        all_turns = [t for g in self.games for t in g.turns]
-        if not all_turns:
+        stats = self._stats()
+        if stats.turns == 0:
             return 0.0
-        return sum(t.correct_guesses for t in all_turns) / len(all_turns)
+        return stats.correct_guesses / stats.turns
 
     @property
     def avg_game_length(self) -> float:
         """Average number of turns per game."""
-        if not self.games:
+        stats = self._stats()
+        if not stats.games:
             return 0.0
-        return sum(g.total_turns for g in self.games) / len(self.games)
+        return stats.game_turns / stats.games
 
     @property
     def total_api_calls(self) -> int:
-        return sum(g.total_api_calls for g in self.games)
+        return self._stats().api_calls
 
     @property
     def total_tokens(self) -> int:
-        return sum(g.total_tokens for g in self.games)
+        return self._stats().tokens
 
     def win_rate_ci(self, confidence: float = 0.95) -> tuple[float, float]:
         """
@@ -168,21 +269,13 @@ class BenchmarkMetrics:
         Returns:
             Tuple of (lower bound, upper bound)
         """
-        from scipy import stats
-
-        n = len(self.games)
-        if n == 0:
-            return (0.0, 0.0)
-
-        p = self.win_rate
-        z = stats.norm.ppf(1 - (1 - confidence) / 2)
-
-        # Wilson score interval
-        denominator = 1 + z**2 / n
-        center = (p + z**2 / (2 * n)) / denominator
-        spread = z * np.sqrt((p * (1 - p) + z**2 / (4 * n)) / n) / denominator
-
-        return (max(0, center - spread), min(1, center + spread))
+        stats = self._stats()
+        ci = stats.win_rate_cis.get(confidence)
+        if ci is None:
+            ci = stats.win_rate_cis[confidence] = _wilson_interval(
+                stats.wins, stats.games, confidence
+            )
+        return ci
 
     def summary(self) -> str:
         """Human-readable summary of benchmark results."""
@@ -224,14 +317,14 @@ class BenchmarkMetrics:
     def save(self, filepath: Path) -> None:
         """Save benchmark results to JSON file."""
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(jsonio.dumps(self.to_dict(), indent=True))
 
     @classmethod
     def load(cls, filepath: Path) -> "BenchmarkMetrics":
         """Load benchmark results from JSON file."""
-        with open(filepath) as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = jsonio.loads(f.read())
 
         metrics = cls(
             config_name=data["config_name"],
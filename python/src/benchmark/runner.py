@@ -1,25 +1,45 @@
 """Benchmark runner for full game simulations."""
 
 import asyncio
+import math
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Sequence
 
 from openai import AsyncOpenAI
 
+from .. import eventloop
 from ..game import GameState, Team, GameRules, BoardGenerator, CardType
 from ..guesser import Guesser, GuesserConfig
 from ..spymaster import Spymaster, SpymasterConfig
-from ..evaluation import ClueSelector, SelectionConfig, AgentConfig
+from ..evaluation import ClueSelector, SelectionConfig, SelectionResult, AgentConfig
+from ..llm import ResponseCache, make_client
+from .gamelog import GameLogWriter
 from .metrics import GameMetrics, TurnMetrics, BenchmarkMetrics
 
 
-@dataclass
+@dataclass(slots=True)
 class RunnerConfig:
     """Configuration for the benchmark runner."""
     max_turns: int = 50  # Safety limit
     verbose: bool = True
+    cache_path: Optional[Path] = None  # SQLite file for cached LLM responses
+    cache_deterministic_only: bool = True  # Only cache temperature == 0 requests
+    max_connections: int = 64  # HTTP connection pool size for the shared client
+    games_log: Optional[Path] = None  # JSONL file each finished game is appended to
+    concurrency: int = 8  # Games played at once by BenchmarkRunner
+    cache_clues: bool = False  # Reuse clue selections for repeated positions (deterministic agents)
+    keep_turns: bool = True  # Keep per-turn detail on in-memory results (the games log always has it)
+
+
+def _build_cache(config: RunnerConfig) -> Optional[ResponseCache]:
+    """Create the response cache described by a runner config, if any."""
+    if config.cache_path is None:
+        return None
+    return ResponseCache(config.cache_path, config.cache_deterministic_only)
 
 
 class GameRunner:
@@ -39,6 +59,8 @@ class GameRunner:
         blue_agent: AgentConfig,
         client: Optional[AsyncOpenAI] = None,
         config: Optional[RunnerConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        clue_cache: Optional[dict[tuple, SelectionResult]] = None,
     ):
         """
         Initialize the game runner.
@@ -48,13 +70,23 @@ class GameRunner:
             blue_agent: Configuration for the BLUE team agent
             client: Shared OpenAI client
             config: Runner configuration
+            cache: Shared response cache (built from config if not provided)
+            clue_cache: Shared clue selections by position (used when
+                config.cache_clues is set; a private one if not provided)
         """
-        self.client = client or AsyncOpenAI()
         self.config = config or RunnerConfig()
+        self.client = client or make_client(self.config.max_connections)
+        self.cache = cache or _build_cache(self.config)
+        if self.config.cache_clues:
+            self.clue_cache = clue_cache if clue_cache is not None else {}
+        else:
+            self.clue_cache = None
 
         # Initialize RED team components
-        self.red_spymaster = Spymaster(red_agent.spymaster, self.client)
-        self.red_guesser = Guesser(red_agent.guesser, self.client)
+        self.red_spymaster = Spymaster(
+            red_agent.spymaster, self.client, cache=self.cache
+        )
+        self.red_guesser = Guesser(red_agent.guesser, self.client, cache=self.cache)
         self.red_selector = ClueSelector(
             self.red_spymaster,
             self.red_guesser,
@@ -62,8 +94,10 @@ class GameRunner:
         )
 
         # Initialize BLUE team components
-        self.blue_spymaster = Spymaster(blue_agent.spymaster, self.client)
-        self.blue_guesser = Guesser(blue_agent.guesser, self.client)
+        self.blue_spymaster = Spymaster(
+            blue_agent.spymaster, self.client, cache=self.cache
+        )
+        self.blue_guesser = Guesser(blue_agent.guesser, self.client, cache=self.cache)
         self.blue_selector = ClueSelector(
             self.blue_spymaster,
             self.blue_guesser,
@@ -73,13 +107,35 @@ class GameRunner:
         self.red_agent = red_agent
         self.blue_agent = blue_agent
 
+        # Per-team dispatch for the turn loop
+        self._selectors = {Team.RED: self.red_selector, Team.BLUE: self.blue_selector}
+        self._guessers = {Team.RED: self.red_guesser, Team.BLUE: self.blue_guesser}
+        self._agent_names = {Team.RED: red_agent.name, Team.BLUE: blue_agent.name}
+
     def _get_selector(self, team: Team) -> ClueSelector:
         """Get the selector for a team."""
-        return self.red_selector if team == Team.RED else self.blue_selector
+        return self._selectors[team]
 
     def _get_guesser(self, team: Team) -> Guesser:
         """Get the guesser for a team."""
-        return self.red_guesser if team == Team.RED else self.blue_guesser
+        return self._guessers[team]
+
+    async def _select_clue(
+        self,
+        selector: ClueSelector,
+        state: GameState,
+        team: Team,
+    ) -> SelectionResult:
+        """Select a clue, via the clue cache when it is enabled."""
+        if self.clue_cache is None:
+            return await selector.select_clue(state, team)
+
+        key = (state.fingerprint(), team, self._agent_names[team])
+        result = self.clue_cache.get(key)
+        if result is None:
+            result = await selector.select_clue(state, team)
+            self.clue_cache[key] = result
+        return result
 
     async def run_game(
         self,
@@ -91,94 +147,130 @@ class GameRunner:
         Run a complete game.
 
         Args:
-            initial_state: Starting game state
+            initial_state: Starting game state (not modified; GameRules
+                returns a new state for every move)
             board_id: Identifier for the board
             on_turn: Optional callback after each turn
 
         Returns:
             GameMetrics with full game statistics
         """
-        start_time = time.time()
-        state = initial_state.copy()
+        # Loop-invariant lookups, bound once for the turn loop
+        now = time.time
+        give_clue = GameRules.give_clue
+        simulate_guesses = GameRules.simulate_guesses
+        select_clue = self._select_clue
+        selectors = self._selectors
+        guessers = self._guessers
+        verbose = self.config.verbose
+        max_turns = self.config.max_turns
+        cache = self.cache
+
+        start_time = now()
+        state = initial_state
         turns: list[TurnMetrics] = []
+        red_turns = 0
+        blue_turns = 0
+        any_assassin = False
 
-        while not state.game_over and len(turns) < self.config.max_turns:
-            turn_start = time.time()
+        while not state.game_over and len(turns) < max_turns:
+            turn_start = now()
             current_team = state.current_team
+            team_is_red = current_team is Team.RED
+            opponent_type = CardType.for_team(current_team.opponent)
+            assassin_type = CardType.ASSASSIN
 
             # Get selector for current team
-            selector = self._get_selector(current_team)
+            selector = selectors[current_team]
 
-            # Select best clue
-            selection_result = await selector.select_clue(state, current_team)
+            # Select best clue (reusing the selection for a repeated position)
+            selection_result = await select_clue(selector, state, current_team)
             selected_clue = selection_result.selected_clue
             clue = selected_clue.to_clue(current_team)
 
-            if self.config.verbose:
-                print(f"\n{current_team.value.upper()} Spymaster: {clue.word} {clue.number}")
-                print(f"  Intended: {', '.join(selected_clue.intended_targets)}")
+            if verbose:
+                # A turn's lines are written together once the turn is over,
+                # so concurrent games don't interleave within a turn
+                team_name = current_team.value.upper()
+                lines = [
+                    f"\n{team_name} Spymaster: {clue.word} {clue.number}",
+                    f"  Intended: {', '.join(selected_clue.intended_targets)}",
+                ]
 
             # Give the clue
-            state = GameRules.give_clue(state, clue)
+            state = give_clue(state, clue)
 
             # Get guesser to respond
-            guesser = self._get_guesser(current_team)
+            guesser = guessers[current_team]
             guesser_output = await guesser.get_guesses(state, clue)
             guesses_to_make = guesser.get_ordered_words(
-                guesser_output, limit=clue.number + 1
+                guesser_output, limit=clue.number + 1, state=state
             )
 
-            if self.config.verbose:
-                print(f"{current_team.value.upper()} Guesser guesses: {guesses_to_make}")
+            if verbose:
+                lines.append(f"{team_name} Guesser guesses: {guesses_to_make}")
 
             # Execute guesses
-            final_state, turn_result = GameRules.simulate_guesses(state, guesses_to_make)
-
-            # Collect turn metrics
-            correct = sum(1 for g in turn_result.guesses if g.correct)
-            hit_assassin = any(g.card_type == CardType.ASSASSIN for g in turn_result.guesses)
-            hit_opponent = any(
-                g.card_type == CardType.for_team(current_team.opponent)
-                for g in turn_result.guesses
-            )
+            final_state, turn_result = simulate_guesses(state, guesses_to_make)
+
+            # Collect turn metrics in a single pass over the guesses
+            guesses_made: list[str] = []
+            correct = 0
+            hit_assassin = False
+            hit_opponent = False
+            for g in turn_result.guesses:
+                guesses_made.append(g.word)
+                correct += g.correct
+                if g.card_type is assassin_type:
+                    hit_assassin = True
+                elif g.card_type is opponent_type:
+                    hit_opponent = True
 
             turn_metrics = TurnMetrics(
                 team=current_team,
                 clue_word=clue.word,
                 clue_number=clue.number,
                 intended_targets=selected_clue.intended_targets,
-                guesses_made=[g.word for g in turn_result.guesses],
+                guesses_made=guesses_made,
                 correct_guesses=correct,
                 hit_assassin=hit_assassin,
                 hit_opponent=hit_opponent,
                 turn_ended_by=turn_result.turn_ended_by,
-                latency_ms=(time.time() - turn_start) * 1000,
+                latency_ms=(now() - turn_start) * 1000,
             )
             turns.append(turn_metrics)
+            red_turns += team_is_red
+            blue_turns += not team_is_red
+            any_assassin |= hit_assassin
 
             if on_turn:
                 on_turn(final_state, turn_metrics)
 
-            if self.config.verbose:
-                print(f"  Result: {correct} correct, ended by {turn_result.turn_ended_by}")
+            if verbose:
+                lines.append(f"  Result: {correct} correct, ended by {turn_result.turn_ended_by}")
                 if final_state.game_over:
-                    print(f"  GAME OVER: {final_state.winner.value.upper()} wins!")
+                    lines.append(f"  GAME OVER: {final_state.winner.value.upper()} wins!")
+                print("\n".join(lines), flush=True)
 
             state = final_state
 
+            # Persist this turn's cached responses
+            if cache is not None:
+                await cache.aflush()
+
         # Compile game metrics
         return GameMetrics(
             board_id=board_id,
             config_name=self.red_agent.name,
             winner=state.winner,
             total_turns=len(turns),
-            red_turns=sum(1 for t in turns if t.team == Team.RED),
-            blue_turns=sum(1 for t in turns if t.team == Team.BLUE),
-            assassin_loss=any(t.hit_assassin for t in turns),
+            red_turns=red_turns,
+            blue_turns=blue_turns,
+            assassin_loss=any_assassin,
             red_final_remaining=state.red_remaining,
             blue_final_remaining=state.blue_remaining,
             turns=turns,
-            game_duration_s=time.time() - start_time,
+            game_duration_s=now() - start_time,
         )
 
 
@@ -198,6 +290,7 @@ class BenchmarkRunner:
         opponent_config: Optional[AgentConfig] = None,
         client: Optional[AsyncOpenAI] = None,
         runner_config: Optional[RunnerConfig] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize the benchmark runner.
@@ -207,65 +300,161 @@ class BenchmarkRunner:
             opponent_config: The opponent agent (uses same config if not specified)
             client: Shared OpenAI client
             runner_config: Runner configuration
+            cache: Shared response cache (built from runner_config if not provided)
         """
         self.agent_config = agent_config
         self.opponent_config = opponent_config or agent_config
-        self.client = client or AsyncOpenAI()
         self.runner_config = runner_config or RunnerConfig()
+        self.client = client or make_client(self.runner_config.max_connections)
+        self.cache = cache or _build_cache(self.runner_config)
+
+        # Game runners hold no per-game state, so one per orientation is
+        # built up front and reused (concurrently) for every game
+        self._runners: dict[bool, GameRunner] = {}
+        # Clue selections shared by both orientations (keyed by agent name)
+        self._clue_cache: dict[tuple, SelectionResult] = {}
+
+    def _get_runner(self, as_blue: bool) -> GameRunner:
+        """Get the game runner with the agent playing BLUE or RED."""
+        runner = self._runners.get(as_blue)
+        if runner is None:
+            if as_blue:
+                # Mirror match - opponent plays RED, agent plays BLUE
+                red, blue = self.opponent_config, self.agent_config
+            else:
+                red, blue = self.agent_config, self.opponent_config
+            runner = GameRunner(
+                red, blue, self.client, self.runner_config, self.cache, self._clue_cache
+            )
+            self._runners[as_blue] = runner
+        return runner
 
     async def run_benchmark(
         self,
-        boards: list[GameState],
+        boards: Sequence[GameState],
         replicates: int = 1,
         mirror: bool = True,
         on_game: Optional[Callable[[GameMetrics], None]] = None,
+        board_offset: int = 0,
     ) -> BenchmarkMetrics:
         """
         Run benchmark on a set of boards.
 
         Args:
-            boards: List of game states to use
+            boards: Game states to use (a list or BoardBatch)
             replicates: Number of times to play each board
             mirror: If True, play twice with teams swapped
             on_game: Optional callback after each game
+            board_offset: Index of the first board (for game ids of a shard)
+
+        Returns:
+            BenchmarkMetrics with aggregated results
+        """
+        semaphore = asyncio.Semaphore(self.runner_config.concurrency)
+        sides = (False, True) if mirror else (False,)
+
+        async with self._open_games_log() as games_log:
+
+            async def play(board: GameState, board_idx: int, rep: int, as_blue: bool) -> GameMetrics:
+                async with semaphore:
+                    metrics = await self._play_game(board, board_idx, rep, as_blue)
+                if on_game:
+                    on_game(metrics)
+                if games_log is not None:
+                    await games_log.write(metrics.to_dict())
+                self._release_turns(metrics)
+                return metrics
+
+            # Games are independent, so up to `concurrency` run at once;
+            # results keep board/replicate/side order
+            all_games = await asyncio.gather(*(
+                play(board, board_idx, rep, as_blue)
+                for board_idx, board in enumerate(boards, start=board_offset)
+                for rep in range(replicates)
+                for as_blue in sides
+            ))
+
+        return BenchmarkMetrics(
+            config_name=self.agent_config.name,
+            total_games=len(all_games),
+            games=list(all_games),
+        )
+
+    async def _play_game(
+        self,
+        board: GameState,
+        board_idx: int,
+        rep: int,
+        as_blue: bool,
+    ) -> GameMetrics:
+        """Play one game of a board, with the agent as RED or (mirrored) BLUE."""
+        side = "blue" if as_blue else "red"
+        runner = self._get_runner(as_blue)
+        metrics = await runner.run_game(board, f"board_{board_idx}_rep_{rep}_{side}")
+
+        if as_blue:
+            # Flip perspective - we track BLUE's performance
+            metrics.config_name = self.agent_config.name
+        return metrics
+
+    async def run_benchmark_parallel(
+        self,
+        boards: Sequence[GameState],
+        workers: int,
+        replicates: int = 1,
+        mirror: bool = True,
+    ) -> BenchmarkMetrics:
+        """
+        Run benchmark with boards split across worker processes.
+
+        Each worker plays a contiguous shard of boards with its own OpenAI
+        client (and connection pool); results are merged in board order.
+        The games log, if configured, is written here after the merge so
+        workers never interleave lines in the file.
+
+        Args:
+            boards: Game states to use (a list or BoardBatch)
+            workers: Number of worker processes
+            replicates: Number of times to play each board
+            mirror: If True, play twice with teams swapped
 
         Returns:
             BenchmarkMetrics with aggregated results
         """
-        all_games: list[GameMetrics] = []
+        shard_size = math.ceil(len(boards) / workers) if len(boards) else 1
+        loop = asyncio.get_running_loop()
+        # Workers return turns whenever the parent still has to log them
+        shard_config = replace(
+            self.runner_config,
+            games_log=None,
+            keep_turns=self.runner_config.keep_turns or self.runner_config.games_log is not None,
+        )
 
-        for board_idx, board in enumerate(boards):
-            for rep in range(replicates):
-                # Play as RED
-                runner = GameRunner(
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shards = await asyncio.gather(*(
+                loop.run_in_executor(
+                    pool,
+                    _run_board_shard,
                     self.agent_config,
                     self.opponent_config,
-                    self.client,
-                    self.runner_config,
+                    shard_config,
+                    boards[start:start + shard_size],
+                    start,
+                    replicates,
+                    mirror,
                 )
-                game_id = f"board_{board_idx}_rep_{rep}_red"
-                metrics = await runner.run_game(board.copy(), game_id)
-                all_games.append(metrics)
+                for start in range(0, len(boards), shard_size)
+            ))
 
-                if on_game:
-                    on_game(metrics)
+        all_games = [game for shard in shards for game in shard]
 
-                # Mirror match - play as BLUE
-                if mirror:
-                    runner = GameRunner(
-                        self.opponent_config,  # Opponent now plays RED
-                        self.agent_config,      # Agent plays BLUE
-                        self.client,
-                        self.runner_config,
-                    )
-                    game_id = f"board_{board_idx}_rep_{rep}_blue"
-                    metrics = await runner.run_game(board.copy(), game_id)
-                    # Flip perspective - we track BLUE's performance
-                    metrics.config_name = self.agent_config.name
-                    all_games.append(metrics)
-
-                    if on_game:
-                        on_game(metrics)
+        async with self._open_games_log() as games_log:
+            if games_log is not None:
+                for game in all_games:
+                    await games_log.write(game.to_dict())
+
+        for game in all_games:
+            self._release_turns(game)
 
         return BenchmarkMetrics(
             config_name=self.agent_config.name,
@@ -273,28 +462,66 @@ class BenchmarkRunner:
             games=all_games,
         )
 
+    def _release_turns(self, metrics: GameMetrics) -> None:
+        """
+        Drop a finished game's turn list unless the config keeps it.
+
+        Aggregates read the per-turn columns built with the GameMetrics,
+        so only the detailed TurnMetrics objects are released.
+        """
+        if not self.runner_config.keep_turns:
+            metrics.turns = []
+
+    def _open_games_log(self):
+        """Open the configured games log (a no-op context if there is none)."""
+        if self.runner_config.games_log is None:
+            return nullcontext()
+        return GameLogWriter(self.runner_config.games_log)
+
     async def run_on_board_set(
         self,
         board_file: Path,
         replicates: int = 1,
         mirror: bool = True,
         max_boards: Optional[int] = None,
+        workers: int = 1,
     ) -> BenchmarkMetrics:
         """
         Run benchmark on a saved board set.
 
         Args:
-            board_file: Path to board set JSON file
+            board_file: Path to board set JSON or JSONL file
             replicates: Number of times to play each board
             mirror: If True, play twice with teams swapped
             max_boards: Limit number of boards (for testing)
+            workers: Number of worker processes (1 runs in this process)
 
         Returns:
             BenchmarkMetrics with aggregated results
         """
-        boards = BoardGenerator.load_boards(board_file)
-
-        if max_boards:
-            boards = boards[:max_boards]
+        boards = BoardGenerator.load_board_batch(board_file, max_boards)
 
+        if workers > 1:
+            return await self.run_benchmark_parallel(boards, workers, replicates, mirror)
         return await self.run_benchmark(boards, replicates, mirror)
+
+
+def _run_board_shard(
+    agent_config: AgentConfig,
+    opponent_config: AgentConfig,
+    runner_config: RunnerConfig,
+    boards: Sequence[GameState],
+    board_offset: int,
+    replicates: int,
+    mirror: bool,
+) -> list[GameMetrics]:
+    """Play a shard of boards in a worker process."""
+    runner = BenchmarkRunner(agent_config, opponent_config, runner_config=runner_config)
+    try:
+        metrics = eventloop.run(runner.run_benchmark(
+            boards, replicates, mirror, board_offset=board_offset
+        ))
+    finally:
+        if runner.cache is not None:
+            runner.cache.close()
+    return metrics.games
@@ -1,15 +1,17 @@
 """Command-line interface for Codenames AI benchmarking."""
 
 import asyncio
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import click
 
+from . import eventloop, jsonio
 from .game import BoardGenerator, Team
 from .evaluation import AgentConfig
 from .benchmark import BenchmarkRunner, RunnerConfig
+from .llm import ResponseCache, make_client
 
 
 @click.group()
@@ -20,14 +22,14 @@ def main():
 
 @main.command()
 @click.option("--count", "-n", default=100, help="Number of boards to generate")
-@click.option("--output", "-o", required=True, type=click.Path(), help="Output file path")
+@click.option("--output", "-o", required=True, type=click.Path(), help="Output file path (.jsonl for one board per line)")
 @click.option("--seed", "-s", type=int, help="Random seed for reproducibility")
 def generate_boards(count: int, output: str, seed: Optional[int]):
     """Generate a board set for benchmarking."""
     click.echo(f"Generating {count} boards...")
 
     generator = BoardGenerator()
-    boards = generator.generate_board_set(count, base_seed=seed)
+    boards = generator.iter_board_set(count, base_seed=seed)
 
     output_path = Path(output)
     BoardGenerator.save_boards(boards, output_path)
@@ -37,12 +39,18 @@ def generate_boards(count: int, output: str, seed: Optional[int]):
 
 @main.command()
 @click.option("--config", "-c", required=True, type=click.Path(exists=True), help="Agent config JSON file")
-@click.option("--boards", "-b", required=True, type=click.Path(exists=True), help="Board set JSON file")
+@click.option("--boards", "-b", required=True, type=click.Path(exists=True), help="Board set JSON or JSONL file")
 @click.option("--output", "-o", type=click.Path(), help="Output results file")
 @click.option("--replicates", "-r", default=1, help="Replicates per board")
 @click.option("--no-mirror", is_flag=True, help="Disable mirror matches")
 @click.option("--max-boards", type=int, help="Limit number of boards")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress verbose output")
+@click.option("--cache", type=click.Path(), help="SQLite file for caching deterministic LLM responses")
+@click.option("--workers", "-w", default=1, help="Worker processes to split boards across")
+@click.option("--games-log", type=click.Path(), help="JSONL file to append each finished game to")
+@click.option("--concurrency", default=8, help="Games played at once (per worker)")
+@click.option("--cache-clues", is_flag=True, help="Reuse clue selections when a board position repeats (for deterministic agents)")
+@click.option("--drop-turns", is_flag=True, help="Keep only per-game results in memory and the output file (turns still go to --games-log, which is required)")
 def benchmark(
     config: str,
     boards: str,
@@ -51,8 +59,18 @@ def benchmark(
     no_mirror: bool,
     max_boards: Optional[int],
     quiet: bool,
+    cache: Optional[str],
+    workers: int,
+    games_log: Optional[str],
+    concurrency: int,
+    cache_clues: bool,
+    drop_turns: bool,
 ):
     """Run benchmark with an agent configuration."""
+    if drop_turns and not games_log:
+        # Otherwise per-turn detail would be discarded without a record
+        raise click.UsageError("--drop-turns requires --games-log")
+
     click.echo(f"Loading config from {config}...")
     agent_config = AgentConfig.load_from_file(config)
 
@@ -60,7 +78,14 @@ def benchmark(
     click.echo(f"Spymaster: {agent_config.spymaster.model}")
     click.echo(f"Guesser: {agent_config.guesser.model}")
 
-    runner_config = RunnerConfig(verbose=not quiet)
+    runner_config = RunnerConfig(
+        verbose=not quiet,
+        cache_path=Path(cache) if cache else None,
+        games_log=Path(games_log) if games_log else None,
+        concurrency=concurrency,
+        cache_clues=cache_clues,
+        keep_turns=not drop_turns,
+    )
     runner = BenchmarkRunner(agent_config, runner_config=runner_config)
 
     async def run():
@@ -69,10 +94,15 @@ def benchmark(
             replicates=replicates,
             mirror=not no_mirror,
             max_boards=max_boards,
+            workers=workers,
         )
 
     click.echo(f"\nRunning benchmark...")
-    metrics = asyncio.run(run())
+    try:
+        metrics = eventloop.run(run())
+    finally:
+        if runner.cache is not None:
+            runner.cache.close()
 
     click.echo(f"\n{metrics.summary()}")
 
@@ -82,6 +112,65 @@ def benchmark(
         click.echo(f"\nResults saved to {output_path}")
 
 
+@main.command()
+@click.option("--config", "-c", "configs", required=True, multiple=True, type=click.Path(exists=True),
+              help="Agent config JSON file (repeat for each variant)")
+@click.option("--boards", "-b", required=True, type=click.Path(exists=True), help="Board set JSON or JSONL file")
+@click.option("--output-dir", "-o", type=click.Path(), help="Directory for per-config result files")
+@click.option("--replicates", "-r", default=1, help="Replicates per board")
+@click.option("--no-mirror", is_flag=True, help="Disable mirror matches")
+@click.option("--max-boards", type=int, help="Limit number of boards")
+@click.option("--cache", type=click.Path(), help="SQLite file for caching deterministic LLM responses")
+def sweep(
+    configs: tuple[str, ...],
+    boards: str,
+    output_dir: Optional[str],
+    replicates: int,
+    no_mirror: bool,
+    max_boards: Optional[int],
+    cache: Optional[str],
+):
+    """Benchmark several agent configurations concurrently."""
+    agent_configs = [AgentConfig.load_from_file(c) for c in configs]
+    click.echo(f"Sweeping {len(agent_configs)} configs: {', '.join(a.name for a in agent_configs)}")
+
+    # One connection pool and response cache shared by every variant
+    runner_config = RunnerConfig(verbose=False, cache_path=Path(cache) if cache else None)
+    client = make_client(runner_config.max_connections)
+    response_cache = ResponseCache(Path(cache), runner_config.cache_deterministic_only) if cache else None
+
+    runners = [
+        BenchmarkRunner(agent_config, client=client, runner_config=runner_config, cache=response_cache)
+        for agent_config in agent_configs
+    ]
+
+    async def run():
+        return await asyncio.gather(*(
+            runner.run_on_board_set(
+                Path(boards),
+                replicates=replicates,
+                mirror=not no_mirror,
+                max_boards=max_boards,
+            )
+            for runner in runners
+        ))
+
+    click.echo(f"\nRunning sweep...")
+    try:
+        all_metrics = eventloop.run(run())
+    finally:
+        if response_cache is not None:
+            response_cache.close()
+
+    for metrics in all_metrics:
+        click.echo(f"\n{metrics.summary()}")
+
+        if output_dir:
+            output_path = Path(output_dir) / f"{metrics.config_name}.json"
+            metrics.save(output_path)
+            click.echo(f"Results saved to {output_path}")
+
+
 @main.command()
 @click.option("--config", "-c", required=True, type=click.Path(exists=True), help="Agent config JSON file")
 @click.option("--seed", "-s", type=int, default=42, help="Random seed for board")
@@ -106,7 +195,7 @@ def play_single(config: str, seed: int):
     async def run():
         return await runner.run_game(state, f"single_game_seed_{seed}")
 
-    metrics = asyncio.run(run())
+    metrics = eventloop.run(run())
 
     click.echo("\n" + "=" * 60)
     click.echo(f"Game finished!")
@@ -157,11 +246,11 @@ def create_config(
 
     output_path = Path(output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(config, f, indent=2)
+    encoded = jsonio.dumps(config, indent=True)
+    output_path.write_bytes(encoded)
 
     click.echo(f"Config saved to {output_path}")
-    click.echo(json.dumps(config, indent=2))
+    click.echo(encoded.decode("utf-8"))
 
 
 @main.command()
@@ -177,10 +266,14 @@ def compare(result_files):
     click.echo(f"{'Config':<20} {'Win Rate':<15} {'95% CI':<20} {'Assassin':<10}")
     click.echo("-" * 70)
 
-    for result_file in result_files:
-        with open(result_file) as f:
-            data = json.load(f)
+    def load(result_file: str) -> dict:
+        return jsonio.loads(Path(result_file).read_bytes())
+
+    # Result files hold every game and can be large; read them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(result_files))) as pool:
+        results = list(pool.map(load, result_files))
 
+    for data in results:
         name = data["config_name"][:20]
         win_rate = data["win_rate"]
         ci_low = data.get("win_rate_ci_low", 0)
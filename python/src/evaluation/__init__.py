@@ -1,6 +1,13 @@
 # Evaluation module
 from .reward import RewardCalculator, RewardConfig, RewardBreakdown
-from .simulator import RolloutSimulator, RolloutResult, SimulatorConfig, BatchSimulator, BatchSimulationResult
+from .simulator import (
+    RolloutSimulator,
+    RolloutResult,
+    PreparedRollout,
+    SimulatorConfig,
+    BatchSimulator,
+    BatchSimulationResult,
+)
 from .aggregator import (
     Aggregator,
     AggregationMethod,
@@ -13,6 +20,8 @@ from .aggregator import (
     MaxAggregator,
     get_aggregator,
 )
+from .batch import submit_batch
+from .bandit import evaluate_candidates_ucb
 from .selector import ClueSelector, SelectionConfig, SelectionResult, AgentConfig
 
 __all__ = [
@@ -23,6 +32,7 @@ __all__ = [
     # Simulator
     "RolloutSimulator",
     "RolloutResult",
+    "PreparedRollout",
     "SimulatorConfig",
     "BatchSimulator",
     "BatchSimulationResult",
@@ -37,6 +47,10 @@ __all__ = [
     "MinAggregator",
     "MaxAggregator",
     "get_aggregator",
+    # Batch API
+    "submit_batch",
+    # Bandit
+    "evaluate_candidates_ucb",
     # Selector
     "ClueSelector",
     "SelectionConfig",
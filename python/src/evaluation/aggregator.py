@@ -1,12 +1,12 @@
 """Aggregation strategies for rollout results."""
 
+import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
-import numpy as np
-
 from .simulator import RolloutResult
 
 
@@ -20,7 +20,7 @@ class AggregationMethod(Enum):
     MAX = "max"
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedScore:
     """Aggregated score for a candidate clue."""
     clue_word: str
@@ -42,6 +42,24 @@ class AggregatedScore:
         )
 
 
+def _percentile(values: list[float], q: float) -> float:
+    """
+    Get the q-th percentile of a few values.
+
+    Uses linear interpolation between closest ranks, as np.percentile does
+    by default; for rollout-sized inputs a sort of the plain list is much
+    cheaper than converting to an array.
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    fraction = position - lower
+    if fraction == 0:
+        return float(ordered[lower])
+    low, high = ordered[lower], ordered[lower + 1]
+    return float(low + (high - low) * fraction)
+
+
 class Aggregator(ABC):
     """Base class for aggregation strategies."""
 
@@ -59,15 +77,34 @@ class Aggregator(ABC):
         pass
 
     def _compute_stats(self, rollouts: list[RolloutResult]) -> tuple[list[float], float, float, float, float]:
-        """Compute basic statistics for rollouts."""
+        """
+        Compute basic statistics for rollouts.
+
+        Raises:
+            ValueError: If there are no rollouts to aggregate
+        """
+        if not rollouts:
+            raise ValueError("Cannot aggregate an empty list of rollouts")
+
         rewards = [r.reward.total_reward for r in rollouts]
-        rewards_array = np.array(rewards)
+
+        # A handful of floats: plain loops beat building a NumPy array.
+        # Two-pass population variance (ddof=0, as np.std), with both passes
+        # taken relative to the first reward: differences of equal floats
+        # are exactly zero, so identical rewards give a std of exactly zero
+        # and a mean equal to the reward itself.
+        n = len(rewards)
+        shift = rewards[0]
+        offset = sum(reward - shift for reward in rewards) / n
+        mean = shift + offset
+        variance = sum((reward - shift - offset) ** 2 for reward in rewards) / n
+
         return (
             rewards,
-            float(np.mean(rewards_array)),
-            float(np.std(rewards_array)),
-            float(np.min(rewards_array)),
-            float(np.max(rewards_array)),
+            float(mean),
+            math.sqrt(variance),
+            float(min(rewards)),
+            float(max(rewards)),
         )
 
 
@@ -136,7 +173,7 @@ class PercentileAggregator(Aggregator):
 
     def aggregate(self, rollouts: list[RolloutResult]) -> AggregatedScore:
         rewards, mean, std, min_val, max_val = self._compute_stats(rollouts)
-        score = float(np.percentile(rewards, self.percentile))
+        score = _percentile(rewards, self.percentile)
         return AggregatedScore(
             clue_word=rollouts[0].clue.word,
             score=score,
@@ -167,11 +204,11 @@ class CVaRAggregator(Aggregator):
     def aggregate(self, rollouts: list[RolloutResult]) -> AggregatedScore:
         rewards, mean, std, min_val, max_val = self._compute_stats(rollouts)
 
-        # Sort rewards and take worst alpha%
+        # Sort rewards and take worst alpha%. Rollout counts are small
+        # enough that a C-level sort beats np.partition plus array setup.
         sorted_rewards = sorted(rewards)
         cutoff_idx = max(1, int(len(sorted_rewards) * self.alpha / 100))
-        worst_rewards = sorted_rewards[:cutoff_idx]
-        score = float(np.mean(worst_rewards))
+        score = sum(sorted_rewards[:cutoff_idx]) / cutoff_idx
 
         return AggregatedScore(
             clue_word=rollouts[0].clue.word,
@@ -219,22 +256,28 @@ class MaxAggregator(Aggregator):
         )
 
 
+_AGGREGATOR_FACTORIES = {
+    AggregationMethod.MEAN: MeanAggregator,
+    AggregationMethod.MEAN_MINUS_STD: MeanMinusStdAggregator,
+    AggregationMethod.PERCENTILE_25: lambda: PercentileAggregator(25),
+    AggregationMethod.CVAR_25: lambda: CVaRAggregator(25),
+    AggregationMethod.MIN: MinAggregator,
+    AggregationMethod.MAX: MaxAggregator,
+}
+
+
+@lru_cache(maxsize=None)
 def get_aggregator(method: AggregationMethod) -> Aggregator:
     """
     Factory function to get an aggregator by method name.
 
+    Aggregators hold no per-call state, so one shared instance is built
+    per method on first use.
+
     Args:
         method: The aggregation method to use
 
     Returns:
         An Aggregator instance
     """
-    aggregators = {
-        AggregationMethod.MEAN: MeanAggregator(),
-        AggregationMethod.MEAN_MINUS_STD: MeanMinusStdAggregator(),
-        AggregationMethod.PERCENTILE_25: PercentileAggregator(25),
-        AggregationMethod.CVAR_25: CVaRAggregator(25),
-        AggregationMethod.MIN: MinAggregator(),
-        AggregationMethod.MAX: MaxAggregator(),
-    }
-    return aggregators[method]
+    return _AGGREGATOR_FACTORIES[method]()
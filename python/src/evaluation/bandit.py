@@ -0,0 +1,107 @@
+"""Adaptive rollout allocation across candidate clues (UCB bandit)."""
+
+import asyncio
+import math
+from typing import Optional
+
+from ..game import GameState, Clue
+from .simulator import RolloutSimulator, RolloutResult, BatchSimulationResult
+
+
+async def evaluate_candidates_ucb(
+    simulator: RolloutSimulator,
+    state: GameState,
+    candidates: list[Clue],
+    budget: int,
+    temperature: Optional[float] = None,
+    exploration: float = 1.0,
+    parallelism: int = 4,
+) -> BatchSimulationResult:
+    """
+    Spend a rollout budget across candidates using UCB1.
+
+    Every candidate gets one rollout, then each further rollout goes to
+    the candidate maximizing mean + c * range * sqrt(ln(N) / n_i), so
+    clearly weak clues stop receiving samples while the leaders are
+    refined. Rollouts are issued in waves of up to `parallelism`; within
+    a wave, already-chosen rollouts count as pending pulls that scored
+    the worst reward seen so far ("virtual loss"), which spreads a wave
+    over several candidates instead of piling onto one.
+
+    Args:
+        simulator: Rollout simulator to draw samples from
+        state: Starting game state
+        candidates: Candidate clues to evaluate
+        budget: Total number of rollouts; at least one per candidate (see
+            the rollout_budget check in AgentConfig)
+        temperature: Override guesser temperature
+        exploration: UCB exploration constant c
+        parallelism: Maximum rollouts in flight at once
+
+    Returns:
+        BatchSimulationResult with a variable number of rollouts per clue
+
+    Raises:
+        ValueError: If the budget can't give every candidate a rollout
+    """
+    if not candidates:
+        return BatchSimulationResult(candidate_results={})
+    if budget < len(candidates):
+        raise ValueError(
+            f"budget ({budget}) must cover one rollout per candidate "
+            f"({len(candidates)} candidates)"
+        )
+
+    candidate_results: dict[str, list[RolloutResult]] = {
+        clue.word: [] for clue in candidates
+    }
+    reward_sums = [0.0] * len(candidates)
+    counts = [0] * len(candidates)
+
+    def record(index: int, result: RolloutResult) -> None:
+        candidate_results[candidates[index].word].append(result)
+        reward_sums[index] += result.reward.total_reward
+        counts[index] += 1
+
+    # Prompt and schema are built once per candidate and reused for every pull
+    prepared = [simulator.prepare(state, clue, temperature) for clue in candidates]
+
+    # Seed every arm with one rollout
+    initial = await asyncio.gather(*(
+        simulator.simulate_prepared(p) for p in prepared
+    ))
+    for index, result in enumerate(initial):
+        record(index, result)
+
+    remaining = budget - len(candidates)
+    while remaining > 0:
+        all_rewards = [
+            r.reward.total_reward
+            for results in candidate_results.values()
+            for r in results
+        ]
+        worst = min(all_rewards)
+        scale = (max(all_rewards) - worst) or 1.0
+
+        pending = [0] * len(candidates)
+        wave: list[int] = []
+        for _ in range(min(parallelism, remaining)):
+            total = sum(counts) + len(wave)
+            best_index, best_ucb = 0, -math.inf
+            for i in range(len(candidates)):
+                n = counts[i] + pending[i]
+                mean = (reward_sums[i] + pending[i] * worst) / n
+                ucb = mean + exploration * scale * math.sqrt(math.log(total) / n)
+                if ucb > best_ucb:
+                    best_index, best_ucb = i, ucb
+            pending[best_index] += 1
+            wave.append(best_index)
+
+        results = await asyncio.gather(*(
+            simulator.simulate_prepared(prepared[i]) for i in wave
+        ))
+        for index, result in zip(wave, results):
+            record(index, result)
+        remaining -= len(wave)
+
+    return BatchSimulationResult(candidate_results=candidate_results)
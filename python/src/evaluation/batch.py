@@ -0,0 +1,77 @@
+"""OpenAI Batch API submission for offline rollout evaluation."""
+
+import asyncio
+from typing import Optional
+
+from openai import AsyncOpenAI
+
+from .. import jsonio
+
+# Batch statuses after which the batch will make no further progress
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+async def submit_batch(
+    client: AsyncOpenAI,
+    requests: list[dict],
+    endpoint: str = "/v1/chat/completions",
+    poll_interval: float = 30.0,
+    completion_window: str = "24h",
+) -> list[Optional[dict]]:
+    """
+    Submit chat completion requests as a single Batch API job.
+
+    Batch jobs are billed at a discount and are not subject to the
+    per-minute rate limits, at the cost of latency (up to the
+    completion window). This makes them a good fit for offline
+    benchmarking where all rollouts of a turn are independent.
+
+    Args:
+        client: OpenAI client
+        requests: List of {"custom_id": str, "body": dict} entries
+        endpoint: API endpoint the request bodies target
+        poll_interval: Seconds between batch status checks
+        completion_window: Batch completion window
+
+    Returns:
+        Response bodies in the same order as requests (None for failed entries)
+    """
+    data = b"".join(
+        jsonio.dumps({
+            "custom_id": r["custom_id"],
+            "method": "POST",
+            "url": endpoint,
+            "body": r["body"],
+        }) + b"\n"
+        for r in requests
+    )
+
+    input_file = await client.files.create(
+        file=("rollouts.jsonl", data),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=endpoint,
+        completion_window=completion_window,
+    )
+
+    while batch.status not in TERMINAL_STATUSES:
+        await asyncio.sleep(poll_interval)
+        batch = await client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or batch.output_file_id is None:
+        raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+    output = await client.files.content(batch.output_file_id)
+
+    bodies: dict[str, dict] = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        item = jsonio.loads(line)
+        response = item.get("response")
+        if response and response.get("status_code") == 200:
+            bodies[item["custom_id"]] = response["body"]
+
+    return [bodies.get(r["custom_id"]) for r in requests]
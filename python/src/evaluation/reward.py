@@ -17,7 +17,7 @@ class RewardConfig:
     loss_penalty: float = -10.0    # Additional penalty for losing
 
 
-@dataclass
+@dataclass(slots=True)
 class RewardBreakdown:
     """Detailed breakdown of reward calculation."""
     correct_words: int
@@ -62,6 +62,25 @@ class RewardCalculator:
         """Initialize with reward configuration."""
         self.config = config or RewardConfig()
 
+        # Per-team lookup from card type to outcome slot
+        # (0 correct, 1 opponent, 2 neutral, 3 assassin)
+        self._slots = {
+            team: {
+                CardType.for_team(team): 0,
+                CardType.for_team(team.opponent): 1,
+                CardType.NEUTRAL: 2,
+                CardType.ASSASSIN: 3,
+            }
+            for team in Team
+        }
+        # Reward for one guess landing in each slot (read once from config)
+        self._slot_rewards = (
+            self.config.correct_word,
+            self.config.opponent_word,
+            self.config.neutral_word,
+            self.config.assassin,
+        )
+
     def calculate_turn_reward(
         self,
         turn_result: TurnResult,
@@ -77,36 +96,27 @@ class RewardCalculator:
         Returns:
             RewardBreakdown with detailed scoring
         """
-        correct_words = 0
-        opponent_words = 0
-        neutral_words = 0
-        hit_assassin = False
-
-        team_card_type = CardType.for_team(team)
-        opponent_card_type = CardType.for_team(team.opponent)
-
+        counts = [0, 0, 0, 0]
+        slots = self._slots[team]
         for guess_result in turn_result.guesses:
-            if guess_result.card_type == team_card_type:
-                correct_words += 1
-            elif guess_result.card_type == opponent_card_type:
-                opponent_words += 1
-            elif guess_result.card_type == CardType.NEUTRAL:
-                neutral_words += 1
-            elif guess_result.card_type == CardType.ASSASSIN:
-                hit_assassin = True
+            counts[slots[guess_result.card_type]] += 1
+
+        correct_words, opponent_words, neutral_words, assassins = counts
+        hit_assassin = assassins > 0
 
         # Calculate total reward
+        correct_reward, opponent_reward, neutral_reward, assassin_reward = self._slot_rewards
         total = 0.0
-        total += correct_words * self.config.correct_word
-        total += opponent_words * self.config.opponent_word
-        total += neutral_words * self.config.neutral_word
+        total += correct_words * correct_reward
+        total += opponent_words * opponent_reward
+        total += neutral_words * neutral_reward
 
         if hit_assassin:
-            total += self.config.assassin
+            total += assassin_reward
 
         # Win/loss bonuses
-        won_game = turn_result.game_over and turn_result.winner == team
-        lost_game = turn_result.game_over and turn_result.winner == team.opponent
+        won_game = turn_result.game_over and turn_result.winner is team
+        lost_game = turn_result.game_over and turn_result.winner is team.opponent
 
         if won_game:
             total += self.config.win_bonus
@@ -138,15 +148,7 @@ class RewardCalculator:
         Returns:
             Reward value for this single guess
         """
-        team_card_type = CardType.for_team(team)
-
-        if card_type == team_card_type:
-            return self.config.correct_word
-        elif card_type == CardType.for_team(team.opponent):
-            return self.config.opponent_word
-        elif card_type == CardType.NEUTRAL:
-            return self.config.neutral_word
-        elif card_type == CardType.ASSASSIN:
-            return self.config.assassin
-        else:
+        slot = self._slots[team].get(card_type)
+        if slot is None:
             return 0.0
+        return self._slot_rewards[slot]
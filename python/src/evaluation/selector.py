@@ -1,12 +1,15 @@
 """Candidate clue selection based on simulated evaluation."""
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
+from .. import jsonio
 from ..game import GameState, Team, Clue
 from ..guesser import Guesser, GuesserConfig
-from ..spymaster import Spymaster, SpymasterConfig, CandidateClue
-from .simulator import BatchSimulator, RolloutResult
+from ..spymaster import Spymaster, SpymasterConfig, CandidateClue, is_legal_clue_word
+from .simulator import BatchSimulator, BatchSimulationResult, RolloutResult, SimulatorConfig
+from .bandit import evaluate_candidates_ucb
 from .aggregator import Aggregator, AggregationMethod, AggregatedScore, get_aggregator
 from .reward import RewardCalculator, RewardConfig
 
@@ -17,9 +20,19 @@ class SelectionConfig:
     eval_samples_per_candidate: int = 3
     eval_temperature: float = 0.3
     aggregation: AggregationMethod = AggregationMethod.MEAN_MINUS_STD
-
-
-@dataclass
+    use_batch_api: bool = False  # Submit rollouts via the Batch API (offline runs)
+    forbid_substring_clues: bool = False  # Reject clues overlapping a board word
+    share_rollout_prompt: bool = True  # Sample a clue's rollouts as n choices of one call
+    rollout_budget: Optional[int] = None  # Total rollouts for UCB allocation (None = uniform)
+    ucb_exploration: float = 1.0  # UCB exploration constant
+    ucb_parallelism: int = 4  # Rollouts in flight per UCB wave
+    skip_eval_when_singleton: bool = False  # Don't simulate when only one candidate is valid
+    race_rollouts: bool = False  # Cancel rollouts of dominated candidates (one call per rollout)
+    race_z: float = 2.0  # Confidence-interval width (in standard errors) for racing
+    max_concurrent_rollouts: Optional[int] = None  # Rollout requests in flight per selector (None = unbounded)
+
+
+@dataclass(slots=True)
 class SelectionResult:
     """Result of the clue selection process."""
     selected_clue: CandidateClue
@@ -77,9 +90,45 @@ class ClueSelector:
         self.config = config
 
         reward_calculator = RewardCalculator(reward_config) if reward_config else None
-        self.batch_simulator = BatchSimulator(guesser, reward_calculator)
+        simulator_config = SimulatorConfig(
+            use_batch_api=config.use_batch_api,
+            share_rollout_prompt=config.share_rollout_prompt,
+            race_rollouts=config.race_rollouts,
+            race_z=config.race_z,
+            max_concurrency=config.max_concurrent_rollouts,
+        )
+        self.batch_simulator = BatchSimulator(guesser, reward_calculator, simulator_config)
         self.aggregator = get_aggregator(config.aggregation)
 
+    async def _evaluate(
+        self,
+        state: GameState,
+        clues: list[Clue],
+    ) -> BatchSimulationResult:
+        """Run rollouts for the candidate clues (uniform or UCB-allocated)."""
+        # Rollouts only see the clue word and number, so candidates that
+        # repeat both (e.g. with other intended targets) share one set;
+        # results are looked up by clue word either way
+        clues = list({(clue.word, clue.number): clue for clue in clues}.values())
+
+        if self.config.rollout_budget is not None:
+            return await evaluate_candidates_ucb(
+                self.batch_simulator.simulator,
+                state,
+                clues,
+                budget=self.config.rollout_budget,
+                temperature=self.config.eval_temperature,
+                exploration=self.config.ucb_exploration,
+                parallelism=self.config.ucb_parallelism,
+            )
+
+        return await self.batch_simulator.evaluate_candidates(
+            state,
+            clues,
+            rollouts_per_candidate=self.config.eval_samples_per_candidate,
+            temperature=self.config.eval_temperature,
+        )
+
     async def select_clue(
         self,
         state: GameState,
@@ -100,44 +149,68 @@ class ClueSelector:
         candidates = spymaster_output.candidates
 
         # Filter out invalid candidates (e.g., clue word is on the board)
-        valid_candidates = []
-        board_words_upper = {w.upper() for w in state.words}
-        for c in candidates:
-            if c.clue.upper() not in board_words_upper and " " not in c.clue:
-                valid_candidates.append(c)
+        valid_candidates = [
+            c for c in candidates
+            if is_legal_clue_word(c.clue, state, self.config.forbid_substring_clues)
+        ]
 
         if not valid_candidates:
             raise ValueError("No valid candidates generated by spymaster")
 
         candidates = valid_candidates
 
+        if len(candidates) == 1 and self.config.skip_eval_when_singleton:
+            # Nothing to choose between - rollouts would only cost LLM calls
+            return self._unevaluated_result(candidates[0])
+
         # Convert to Clue objects for simulation
         clues = [c.to_clue(team) for c in candidates]
 
         # Evaluate all candidates
-        batch_result = await self.batch_simulator.evaluate_candidates(
-            state,
-            clues,
-            rollouts_per_candidate=self.config.eval_samples_per_candidate,
-            temperature=self.config.eval_temperature,
-        )
+        batch_result = await self._evaluate(state, clues)
+
+        return self._select_best(candidates, batch_result)
 
-        # Aggregate scores for each candidate
-        all_scores: list[AggregatedScore] = []
-        for candidate in candidates:
-            rollouts = batch_result.candidate_results[candidate.clue]
-            score = self.aggregator.aggregate(rollouts)
-            all_scores.append(score)
+    def _select_best(
+        self,
+        candidates: list[CandidateClue],
+        batch_result: BatchSimulationResult,
+    ) -> SelectionResult:
+        """Score the evaluated candidates and pick the highest-scoring one."""
+        # Aggregate scores for each candidate (aligned with candidates)
+        candidate_results = batch_result.candidate_results
+        all_scores = [
+            self.aggregator.aggregate(candidate_results[candidate.clue])
+            for candidate in candidates
+        ]
 
-        # Select the best
-        best_score = max(all_scores, key=lambda s: s.score)
-        best_candidate = next(c for c in candidates if c.clue == best_score.clue_word)
+        # Select the best (the first one on ties)
+        best_idx = max(range(len(all_scores)), key=lambda i: all_scores[i].score)
 
         return SelectionResult(
-            selected_clue=best_candidate,
-            selected_score=best_score,
+            selected_clue=candidates[best_idx],
+            selected_score=all_scores[best_idx],
             all_scores=all_scores,
-            all_rollouts=batch_result.candidate_results,
+            all_rollouts=candidate_results,
+        )
+
+    def _unevaluated_result(self, candidate: CandidateClue) -> SelectionResult:
+        """Build a selection result for a candidate chosen without rollouts."""
+        score = AggregatedScore(
+            clue_word=candidate.clue,
+            score=0.0,
+            mean=0.0,
+            std=0.0,
+            min=0.0,
+            max=0.0,
+            n_rollouts=0,
+            raw_rewards=[],
+        )
+        return SelectionResult(
+            selected_clue=candidate,
+            selected_score=score,
+            all_scores=[score],
+            all_rollouts={candidate.clue: []},
         )
 
     async def select_clue_with_candidates(
@@ -164,30 +237,9 @@ class ClueSelector:
         clues = [c.to_clue(team) for c in candidates]
 
         # Evaluate all candidates
-        batch_result = await self.batch_simulator.evaluate_candidates(
-            state,
-            clues,
-            rollouts_per_candidate=self.config.eval_samples_per_candidate,
-            temperature=self.config.eval_temperature,
-        )
+        batch_result = await self._evaluate(state, clues)
 
-        # Aggregate scores for each candidate
-        all_scores: list[AggregatedScore] = []
-        for candidate in candidates:
-            rollouts = batch_result.candidate_results[candidate.clue]
-            score = self.aggregator.aggregate(rollouts)
-            all_scores.append(score)
-
-        # Select the best
-        best_score = max(all_scores, key=lambda s: s.score)
-        best_candidate = next(c for c in candidates if c.clue == best_score.clue_word)
-
-        return SelectionResult(
-            selected_clue=best_candidate,
-            selected_score=best_score,
-            all_scores=all_scores,
-            all_rollouts=batch_result.candidate_results,
-        )
+        return self._select_best(candidates, batch_result)
 
 
 @dataclass
@@ -198,6 +250,14 @@ class AgentConfig:
     guesser: GuesserConfig
     selection: SelectionConfig
 
+    def __post_init__(self):
+        budget = self.selection.rollout_budget
+        if budget is not None and budget < self.spymaster.candidates_per_turn:
+            raise ValueError(
+                f"rollout_budget ({budget}) must cover one rollout per candidate "
+                f"(candidates_per_turn={self.spymaster.candidates_per_turn})"
+            )
+
     @classmethod
     def from_dict(cls, data: dict) -> "AgentConfig":
         """Load config from a dictionary (e.g., from JSON)."""
@@ -208,25 +268,33 @@ class AgentConfig:
                 prompt_id=data["spymaster"]["prompt_id"],
                 temperature=data["spymaster"]["temperature"],
                 candidates_per_turn=data["spymaster"]["candidates_per_turn"],
+                candidates_per_call=data["spymaster"].get("candidates_per_call"),
+                enum_schema=data["spymaster"].get("enum_schema", True),
             ),
             guesser=GuesserConfig(
                 model=data["guesser"]["model"],
                 prompt_id=data["guesser"]["prompt_id"],
                 temperature=data["guesser"]["temperature"],
+                enum_schema=data["guesser"].get("enum_schema", True),
             ),
             selection=SelectionConfig(
                 eval_samples_per_candidate=data["selection"]["eval_samples_per_candidate"],
                 eval_temperature=data["selection"]["eval_temperature"],
                 aggregation=AggregationMethod(data["selection"]["aggregation"]),
+                use_batch_api=data["selection"].get("use_batch_api", False),
+                forbid_substring_clues=data["selection"].get("forbid_substring_clues", False),
+                share_rollout_prompt=data["selection"].get("share_rollout_prompt", True),
+                rollout_budget=data["selection"].get("rollout_budget"),
+                ucb_exploration=data["selection"].get("ucb_exploration", 1.0),
+                ucb_parallelism=data["selection"].get("ucb_parallelism", 4),
+                skip_eval_when_singleton=data["selection"].get("skip_eval_when_singleton", False),
+                race_rollouts=data["selection"].get("race_rollouts", False),
+                race_z=data["selection"].get("race_z", 2.0),
+                max_concurrent_rollouts=data["selection"].get("max_concurrent_rollouts"),
             ),
         )
 
     @classmethod
     def load_from_file(cls, filepath: str) -> "AgentConfig":
         """Load config from a JSON file."""
-        import json
-        from pathlib import Path
-
-        with open(Path(filepath)) as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(jsonio.loads(Path(filepath).read_bytes()))
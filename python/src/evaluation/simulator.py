@@ -1,28 +1,55 @@
 """Rollout simulator for evaluating candidate clues."""
 
+import asyncio
+import logging
+import math
+import statistics
 from dataclasses import dataclass
 from typing import Optional
 
 from ..game import GameState, Team, Clue, GameRules, TurnResult
 from ..guesser import Guesser, GuesserConfig, GuesserOutput
+from .batch import submit_batch
 from .reward import RewardCalculator, RewardBreakdown, RewardConfig
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class RolloutResult:
     """Result of a single rollout simulation."""
     clue: Clue
-    guesser_output: GuesserOutput
-    guesses_made: list[str]
+    guesser_output: Optional[GuesserOutput]  # None unless the config keeps it
     turn_result: TurnResult
     reward: RewardBreakdown
 
+    @property
+    def guesses_made(self) -> list[str]:
+        """Words actually guessed, in order (invalid guesses are skipped)."""
+        return [guess.word for guess in self.turn_result.guesses]
+
+
+@dataclass(slots=True)
+class PreparedRollout:
+    """A clue applied to the board plus the guesser request for it."""
+    clue: Clue
+    state_with_clue: GameState
+    request: dict
+
 
 @dataclass
 class SimulatorConfig:
     """Configuration for the rollout simulator."""
     max_guesses: Optional[int] = None  # None means use clue.number + 1
     use_stop_recommendation: bool = True  # Honor guesser's stop_after
+    use_batch_api: bool = False  # Submit rollouts via the Batch API (offline runs)
+    batch_poll_interval: float = 30.0  # Seconds between batch status checks
+    share_rollout_prompt: bool = True  # Sample a clue's rollouts as n choices of one call
+    race_rollouts: bool = False  # Cancel remaining rollouts of clearly dominated candidates
+    race_z: float = 2.0  # Confidence-interval width (in standard errors) for racing
+    race_min_samples: int = 2  # Rollouts a candidate needs before it can be compared
+    max_concurrency: Optional[int] = None  # Guesser requests in flight at once (None = unbounded)
+    keep_guesser_output: bool = False  # Keep each rollout's full guesser output (reasoning text)
 
 
 class RolloutSimulator:
@@ -55,6 +82,19 @@ class RolloutSimulator:
         self.guesser = guesser
         self.reward_calculator = reward_calculator or RewardCalculator()
         self.config = config or SimulatorConfig()
+        # Bounds rollout requests across every evaluation path of this
+        # simulator, so a wide turn doesn't trip provider rate limits
+        self._limit = (
+            asyncio.Semaphore(self.config.max_concurrency)
+            if self.config.max_concurrency else None
+        )
+
+    async def _complete(self, request: dict, n: int = 1) -> list[GuesserOutput]:
+        """Sample guesser outputs for a request, within the concurrency limit."""
+        if self._limit is None:
+            return await self.guesser.complete(request, n)
+        async with self._limit:
+            return await self.guesser.complete(request, n)
 
     async def simulate_turn(
         self,
@@ -73,14 +113,41 @@ class RolloutSimulator:
         Returns:
             RolloutResult with full simulation details
         """
-        # Give the clue
+        return await self.simulate_prepared(self.prepare(state, clue, temperature))
+
+    def prepare(
+        self,
+        state: GameState,
+        clue: Clue,
+        temperature: Optional[float] = None,
+    ) -> PreparedRollout:
+        """
+        Give the clue and build the guesser request once for reuse.
+
+        Args:
+            state: Starting game state (before clue is given)
+            clue: The clue to evaluate
+            temperature: Override guesser temperature
+
+        Returns:
+            PreparedRollout shared by every rollout of this clue
+        """
         state_with_clue = GameRules.give_clue(state, clue)
+        request = self.guesser.build_request(state_with_clue, clue, temperature)
+        return PreparedRollout(clue, state_with_clue, request)
 
-        # Get guesser's response
-        guesser_output = await self.guesser.get_guesses(
-            state_with_clue, clue, temperature=temperature
-        )
+    async def simulate_prepared(self, prepared: PreparedRollout) -> RolloutResult:
+        """Run a single rollout of a prepared clue."""
+        guesser_output = (await self._complete(prepared.request))[0]
+        return self._finalize(prepared.state_with_clue, prepared.clue, guesser_output)
 
+    def _finalize(
+        self,
+        state_with_clue: GameState,
+        clue: Clue,
+        guesser_output: GuesserOutput,
+    ) -> RolloutResult:
+        """Apply a guesser output to the game state and score the turn."""
         # Determine how many guesses to make
         max_guesses = self.config.max_guesses or (clue.number + 1)
 
@@ -90,7 +157,7 @@ class RolloutSimulator:
 
         # Get ordered guess words
         guesses_to_make = self.guesser.get_ordered_words(
-            guesser_output, limit=max_guesses
+            guesser_output, limit=max_guesses, state=state_with_clue
         )
 
         # Simulate the guesses
@@ -105,8 +172,7 @@ class RolloutSimulator:
 
         return RolloutResult(
             clue=clue,
-            guesser_output=guesser_output,
-            guesses_made=guesses_to_make[:len(turn_result.guesses)],
+            guesser_output=guesser_output if self.config.keep_guesser_output else None,
             turn_result=turn_result,
             reward=reward,
         )
@@ -130,16 +196,20 @@ class RolloutSimulator:
         Returns:
             List of RolloutResults
         """
-        import asyncio
+        prepared = self.prepare(state, clue, temperature)
 
-        tasks = [
-            self.simulate_turn(state, clue, temperature)
-            for _ in range(n)
+        if not self.config.share_rollout_prompt:
+            tasks = [self.simulate_prepared(prepared) for _ in range(n)]
+            return await asyncio.gather(*tasks)
+
+        guesser_outputs = await self._complete(prepared.request, n)
+        return [
+            self._finalize(prepared.state_with_clue, clue, guesser_output)
+            for guesser_output in guesser_outputs
         ]
-        return await asyncio.gather(*tasks)
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchSimulationResult:
     """Result of simulating multiple candidates."""
     candidate_results: dict[str, list[RolloutResult]]  # clue word -> rollouts
@@ -178,30 +248,190 @@ class BatchSimulator:
         Returns:
             BatchSimulationResult with all rollout results
         """
-        import asyncio
+        if self.simulator.config.use_batch_api:
+            return await self._evaluate_with_batch_api(
+                state, candidates, rollouts_per_candidate, temperature
+            )
+
+        if self.simulator.config.race_rollouts:
+            return await self._evaluate_racing(
+                state, candidates, rollouts_per_candidate, temperature
+            )
+
+        # Run all simulations in parallel; gather keeps candidate order, so
+        # each candidate's rollouts line up with its clue
+        results = await asyncio.gather(*(
+            self.simulator.simulate_multiple(state, clue, rollouts_per_candidate, temperature)
+            for clue in candidates
+        ))
+
+        candidate_results: dict[str, list[RolloutResult]] = {
+            clue.word: [] for clue in candidates
+        }
+        for clue, rollouts in zip(candidates, results):
+            candidate_results[clue.word].extend(rollouts)
 
-        # Create all simulation tasks
-        all_tasks = []
-        task_to_clue = {}
+        return BatchSimulationResult(candidate_results=candidate_results)
 
-        for clue in candidates:
-            tasks = [
-                self.simulator.simulate_turn(state, clue, temperature)
-                for _ in range(rollouts_per_candidate)
-            ]
-            for task in tasks:
-                task_to_clue[id(task)] = clue.word
-            all_tasks.extend(tasks)
+    async def _evaluate_racing(
+        self,
+        state: GameState,
+        candidates: list[Clue],
+        rollouts_per_candidate: int,
+        temperature: Optional[float],
+    ) -> BatchSimulationResult:
+        """
+        Evaluate candidates with one call per rollout, racing them.
 
-        # Run all simulations in parallel
-        results = await asyncio.gather(*all_tasks)
+        Every rollout is started up front. As results arrive, a candidate
+        whose reward confidence interval lies entirely below the best
+        candidate's has its outstanding rollouts cancelled, so no more
+        tokens are spent on it. Pruned candidates keep the rollouts that
+        already finished.
+        """
+        config = self.simulator.config
+        prepared = [
+            self.simulator.prepare(state, clue, temperature) for clue in candidates
+        ]
 
-        # Organize results by clue
+        pending: dict[asyncio.Task, int] = {
+            asyncio.ensure_future(self.simulator.simulate_prepared(p)): cand_idx
+            for cand_idx, p in enumerate(prepared)
+            for _ in range(rollouts_per_candidate)
+        }
+        cancelled: list[asyncio.Task] = []
+        rewards: list[list[float]] = [[] for _ in candidates]
         candidate_results: dict[str, list[RolloutResult]] = {
             clue.word: [] for clue in candidates
         }
 
-        for i, result in enumerate(results):
-            candidate_results[result.clue.word].append(result)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    cand_idx = pending.pop(task)
+                    result = task.result()
+                    candidate_results[result.clue.word].append(result)
+                    rewards[cand_idx].append(result.reward.total_reward)
+
+                dominated = _dominated_candidates(
+                    rewards, config.race_z, config.race_min_samples
+                )
+                if dominated:
+                    for task, cand_idx in list(pending.items()):
+                        if cand_idx in dominated:
+                            task.cancel()
+                            cancelled.append(task)
+                            del pending[task]
+        finally:
+            for task in pending:
+                task.cancel()
+                cancelled.append(task)
+            await asyncio.gather(*cancelled, return_exceptions=True)
+
+        return BatchSimulationResult(candidate_results=candidate_results)
+
+    async def _evaluate_with_batch_api(
+        self,
+        state: GameState,
+        candidates: list[Clue],
+        rollouts_per_candidate: int,
+        temperature: Optional[float],
+    ) -> BatchSimulationResult:
+        """
+        Evaluate candidates by submitting every rollout in one Batch API job.
+
+        Failed batch entries are dropped; candidates left with no rollouts
+        at all are re-run with live guesser calls, so every candidate comes
+        back with at least one rollout.
+        """
+        guesser = self.simulator.guesser
+
+        prepared = [
+            self.simulator.prepare(state, clue, temperature) for clue in candidates
+        ]
+        requests = [
+            {
+                "custom_id": f"{cand_idx}:{sample_idx}",
+                "body": p.request,
+            }
+            for cand_idx, p in enumerate(prepared)
+            for sample_idx in range(rollouts_per_candidate)
+        ]
+
+        bodies = await submit_batch(
+            guesser.client,
+            requests,
+            poll_interval=self.simulator.config.batch_poll_interval,
+        )
+
+        candidate_results: dict[str, list[RolloutResult]] = {
+            clue.word: [] for clue in candidates
+        }
+        failed = 0
+        for request, body in zip(requests, bodies):
+            if body is None:
+                # Failed entries are dropped rather than failing the whole turn
+                failed += 1
+                continue
+            p = prepared[int(request["custom_id"].split(":")[0])]
+            guesser_output = guesser.parse_content(
+                body["choices"][0]["message"]["content"]
+            )
+            candidate_results[p.clue.word].append(
+                self.simulator._finalize(p.state_with_clue, p.clue, guesser_output)
+            )
+
+        missing = [p for p in prepared if not candidate_results[p.clue.word]]
+        if failed:
+            logger.warning(
+                "%d of %d batch rollouts failed; re-running %d candidate(s) "
+                "with no rollouts left using live calls",
+                failed, len(requests), len(missing),
+            )
+
+        outputs = await asyncio.gather(*(
+            self.simulator._complete(p.request, rollouts_per_candidate) for p in missing
+        ))
+        for p, guesser_outputs in zip(missing, outputs):
+            candidate_results[p.clue.word] = [
+                self.simulator._finalize(p.state_with_clue, p.clue, guesser_output)
+                for guesser_output in guesser_outputs
+            ]
 
         return BatchSimulationResult(candidate_results=candidate_results)
+
+
+def _dominated_candidates(
+    rewards: list[list[float]],
+    z: float,
+    min_samples: int,
+) -> set[int]:
+    """
+    Find candidates that are confidently worse than the current best.
+
+    Args:
+        rewards: Rollout rewards observed so far, per candidate
+        z: Confidence-interval half-width in standard errors
+        min_samples: Rollouts required before a candidate is compared
+
+    Returns:
+        Indices of candidates whose upper bound is below the best lower bound
+    """
+    min_samples = max(min_samples, 2)
+    bounds: dict[int, tuple[float, float]] = {}
+    for i, r in enumerate(rewards):
+        k = len(r)
+        if k < min_samples:
+            continue
+        mean = sum(r) / k
+        half_width = z * statistics.stdev(r) / math.sqrt(k)
+        bounds[i] = (mean - half_width, mean + half_width)
+
+    if len(bounds) < 2:
+        return set()
+
+    best_lower = max(lower for lower, _ in bounds.values())
+    return {i for i, (_, upper) in bounds.items() if upper < best_lower}
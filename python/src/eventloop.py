@@ -0,0 +1,31 @@
+"""Event loop selection for running the async benchmark drivers."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional, Unix-only extra
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+
+    uvloop's libuv-based loop has noticeably lower per-request overhead
+    when hundreds of LLM calls are in flight; without it this is just
+    asyncio.run.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
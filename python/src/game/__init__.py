@@ -2,7 +2,7 @@
 from .state import GameState, Team, CardType, Card, Clue, GuessResult
 from .board import Board
 from .rules import GameRules, TurnResult
-from .generator import BoardGenerator
+from .generator import BoardGenerator, BoardBatch
 
 __all__ = [
     "GameState",
@@ -15,4 +15,5 @@ __all__ = [
     "GameRules",
     "TurnResult",
     "BoardGenerator",
+    "BoardBatch",
 ]
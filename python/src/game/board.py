@@ -1,12 +1,33 @@
 """Board representation for Codenames."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Optional
 
 from .state import Card, CardType, Team, GameState
 
-
-@dataclass
+# Padded type cells for the text renderings, built once
+_SPYMASTER_SYMBOLS = {
+    CardType.RED: "R",
+    CardType.BLUE: "B",
+    CardType.NEUTRAL: ".",
+    CardType.ASSASSIN: "X",
+}
+_SPYMASTER_CELLS = {t: f"{symbol:^12}" for t, symbol in _SPYMASTER_SYMBOLS.items()}
+_REVEALED_SPYMASTER_CELLS = {
+    t: f"{symbol.lower():^12}" for t, symbol in _SPYMASTER_SYMBOLS.items()
+}
+_GUESSER_CELLS = {
+    t: f"{symbol:^12}" for t, symbol in {
+        CardType.RED: "[RED]",
+        CardType.BLUE: "[BLU]",
+        CardType.NEUTRAL: "[---]",
+        CardType.ASSASSIN: "[XXX]",
+    }.items()
+}
+
+
+@dataclass(slots=True)
 class Board:
     """
     A 5x5 Codenames board.
@@ -16,6 +37,15 @@ class Board:
     """
     cards: list[Card]
 
+    # Uppercased word -> card index, built on first lookup (words never change)
+    _word_index: Optional[dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Card type -> indices holding it, built on first use (types never change)
+    _type_indices: Optional[dict[CardType, tuple[int, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         if len(self.cards) != 25:
             raise ValueError(f"Board must have exactly 25 cards, got {len(self.cards)}")
@@ -37,19 +67,21 @@ class Board:
 
     def get_card_by_word(self, word: str) -> Optional[Card]:
         """Get a card by its word (case-insensitive)."""
-        word_upper = word.upper()
-        for card in self.cards:
-            if card.word.upper() == word_upper:
-                return card
-        return None
+        index = self.get_index_by_word(word)
+        if index is None:
+            return None
+        return self.cards[index]
 
     def get_index_by_word(self, word: str) -> Optional[int]:
         """Get the index of a card by its word (case-insensitive)."""
-        word_upper = word.upper()
-        for i, card in enumerate(self.cards):
-            if card.word.upper() == word_upper:
-                return i
-        return None
+        if self._word_index is None:
+            self._word_index = {
+                sys.intern(card.word.upper()): i for i, card in enumerate(self.cards)
+            }
+        index = self._word_index.get(word)
+        if index is None:
+            index = self._word_index.get(word.upper())
+        return index
 
     @property
     def all_words(self) -> list[str]:
@@ -66,15 +98,26 @@ class Board:
         """Get words that have been revealed."""
         return [card.word for card in self.cards if card.revealed]
 
+    def _indices_of_type(self, card_type: CardType) -> tuple[int, ...]:
+        """Get the board positions holding a card type."""
+        if self._type_indices is None:
+            indices: dict[CardType, list[int]] = {t: [] for t in CardType}
+            for i, card in enumerate(self.cards):
+                indices[card.card_type].append(i)
+            self._type_indices = {t: tuple(idx) for t, idx in indices.items()}
+        return self._type_indices[card_type]
+
     def get_words_by_type(self, card_type: CardType) -> list[str]:
         """Get all words of a specific type."""
-        return [card.word for card in self.cards if card.card_type == card_type]
+        cards = self.cards
+        return [cards[i].word for i in self._indices_of_type(card_type)]
 
     def get_unrevealed_by_type(self, card_type: CardType) -> list[str]:
         """Get unrevealed words of a specific type."""
+        cards = self.cards
         return [
-            card.word for card in self.cards
-            if card.card_type == card_type and not card.revealed
+            cards[i].word for i in self._indices_of_type(card_type)
+            if not cards[i].revealed
         ]
 
     def get_team_words(self, team: Team) -> list[str]:
@@ -90,51 +133,32 @@ class Board:
     @property
     def assassin_word(self) -> str:
         """Get the assassin word."""
-        for card in self.cards:
-            if card.card_type == CardType.ASSASSIN:
-                return card.word
-        raise ValueError("No assassin card found on board")
+        indices = self._indices_of_type(CardType.ASSASSIN)
+        if not indices:
+            raise ValueError("No assassin card found on board")
+        return self.cards[indices[0]].word
 
     def render_for_spymaster(self) -> str:
         """Render the board as a string showing all card types (spymaster view)."""
+        cards = self.cards
         lines = []
-        type_symbols = {
-            CardType.RED: "R",
-            CardType.BLUE: "B",
-            CardType.NEUTRAL: ".",
-            CardType.ASSASSIN: "X",
-        }
-        for row in range(5):
-            row_words = []
-            row_types = []
-            for col in range(5):
-                card = self.get_card(row, col)
-                symbol = type_symbols[card.card_type]
-                if card.revealed:
-                    symbol = symbol.lower()
-                row_words.append(f"{card.word:12}")
-                row_types.append(f"{symbol:^12}")
-            lines.append(" ".join(row_words))
-            lines.append(" ".join(row_types))
+        for start in range(0, 25, 5):
+            row = cards[start:start + 5]
+            lines.append(" ".join([f"{card.word:12}" for card in row]))
+            lines.append(" ".join([
+                (_REVEALED_SPYMASTER_CELLS if card.revealed else _SPYMASTER_CELLS)[card.card_type]
+                for card in row
+            ]))
             lines.append("")
         return "\n".join(lines)
 
     def render_for_guesser(self) -> str:
         """Render the board as a string (guesser view - only revealed types shown)."""
-        lines = []
-        for row in range(5):
-            row_words = []
-            for col in range(5):
-                card = self.get_card(row, col)
-                if card.revealed:
-                    symbol = {
-                        CardType.RED: "[RED]",
-                        CardType.BLUE: "[BLU]",
-                        CardType.NEUTRAL: "[---]",
-                        CardType.ASSASSIN: "[XXX]",
-                    }[card.card_type]
-                    row_words.append(f"{symbol:^12}")
-                else:
-                    row_words.append(f"{card.word:12}")
-            lines.append(" ".join(row_words))
-        return "\n".join(lines)
+        cards = self.cards
+        return "\n".join([
+            " ".join([
+                _GUESSER_CELLS[card.card_type] if card.revealed else f"{card.word:12}"
+                for card in cards[start:start + 5]
+            ])
+            for start in range(0, 25, 5)
+        ])
@@ -1,13 +1,110 @@
 """Board and game state generator for Codenames."""
 
-import json
 import random
+import sys
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union, overload
+
+import numpy as np
 
 from .state import GameState, Team, CardType
+from .. import jsonio
 from ..paths import WORDLIST_PATH
 
+# Parsed word lists keyed by path: (file mtime, words, normalized words)
+_WORDLIST_CACHE: dict[Path, tuple[int, list[str], list[str]]] = {}
+
+# Integer codes used by BoardBatch columns
+_CARD_TYPES = tuple(CardType)
+_CARD_CODES = {t: code for code, t in enumerate(_CARD_TYPES)}
+_TEAMS = tuple(Team)
+_TEAM_CODES = {t: code for code, t in enumerate(_TEAMS)}
+
+
+@dataclass(frozen=True)
+class BoardBatch:
+    """
+    A board set stored column-wise.
+
+    Each column holds one field for every board, so a large set is a few
+    compact arrays instead of one object graph per board; slicing returns
+    views, which keeps shards cheap to pickle for worker processes.
+    Indexing builds a fresh GameState for that board.
+    """
+    words: np.ndarray           # (N, 25) object array of board words
+    keys: np.ndarray            # (N, 25) int8 codes into CardType
+    starting_team: np.ndarray   # (N,) int8 codes into Team
+    red_remaining: np.ndarray   # (N,) int8
+    blue_remaining: np.ndarray  # (N,) int8
+
+    @classmethod
+    def from_states(cls, states: Iterable[GameState]) -> "BoardBatch":
+        """Build a batch from board starting states."""
+        states = list(states)
+        if not states:
+            # reshape can't infer the board width of an empty set
+            empty = np.empty(0, dtype=np.int8)
+            return cls(
+                words=np.empty((0, BoardGenerator.TOTAL_CARDS), dtype=object),
+                keys=np.empty((0, BoardGenerator.TOTAL_CARDS), dtype=np.int8),
+                starting_team=empty,
+                red_remaining=empty.copy(),
+                blue_remaining=empty.copy(),
+            )
+        return cls(
+            words=np.array([s.words for s in states], dtype=object).reshape(len(states), -1),
+            keys=np.array(
+                [[_CARD_CODES[t] for t in s.key] for s in states], dtype=np.int8
+            ).reshape(len(states), -1),
+            starting_team=np.array([_TEAM_CODES[s.current_team] for s in states], dtype=np.int8),
+            red_remaining=np.array([s.red_remaining for s in states], dtype=np.int8),
+            blue_remaining=np.array([s.blue_remaining for s in states], dtype=np.int8),
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @overload
+    def __getitem__(self, index: int) -> GameState: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BoardBatch": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[GameState, "BoardBatch"]:
+        if isinstance(index, slice):
+            return BoardBatch(
+                words=self.words[index],
+                keys=self.keys[index],
+                starting_team=self.starting_team[index],
+                red_remaining=self.red_remaining[index],
+                blue_remaining=self.blue_remaining[index],
+            )
+
+        words = self.words[index].tolist()
+        return GameState(
+            words=words,
+            key=[_CARD_TYPES[code] for code in self.keys[index].tolist()],
+            revealed=[False] * len(words),
+            current_team=_TEAMS[self.starting_team[index]],
+            red_remaining=int(self.red_remaining[index]),
+            blue_remaining=int(self.blue_remaining[index]),
+        )
+
+    def __iter__(self) -> Iterator[GameState]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def count_cards(self, card_type: CardType) -> np.ndarray:
+        """Count the cards of a type on every board in one pass."""
+        return np.count_nonzero(self.keys == _CARD_CODES[card_type], axis=1)
+
+
+def _normalize_words(words: Iterable[str]) -> list[str]:
+    """Uppercase words, interned so board words compare by identity in lookups."""
+    return [sys.intern(w.upper()) for w in words]
+
 
 class BoardGenerator:
     """
@@ -32,52 +129,76 @@ class BoardGenerator:
             word_list: List of words to use. If None, loads the default word list.
         """
         if word_list is None:
-            word_list = self._load_default_wordlist()
-        self.word_list = [w.upper() for w in word_list]
+            self._load_default_wordlist()
+            self.word_list = list(_WORDLIST_CACHE[WORDLIST_PATH][2])
+        else:
+            self.word_list = _normalize_words(word_list)
+
+        # The unshuffled key only depends on the starting team
+        self._key_templates = {team: self._build_key(team) for team in Team}
 
     @staticmethod
     def _load_default_wordlist() -> list[str]:
-        """Load the default word list from shared/wordlist.json."""
+        """
+        Load the default word list from shared/wordlist.json.
+
+        The parsed list (and its normalized form, used by generators built
+        without a word list) is memoized per process and re-read only when
+        the file's mtime changes.
+        """
         if not WORDLIST_PATH.exists():
             raise FileNotFoundError(
                 f"Could not find wordlist.json at {WORDLIST_PATH}. "
                 "Please ensure shared/wordlist.json exists."
             )
 
-        with open(WORDLIST_PATH) as f:
-            data = json.load(f)
-            return data["words"]
+        mtime = WORDLIST_PATH.stat().st_mtime_ns
+        cached = _WORDLIST_CACHE.get(WORDLIST_PATH)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        words = jsonio.loads(WORDLIST_PATH.read_bytes())["words"]
+
+        _WORDLIST_CACHE[WORDLIST_PATH] = (mtime, words, _normalize_words(words))
+        return list(words)
 
     def generate_board(
         self,
         starting_team: Team = Team.RED,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None,
     ) -> GameState:
         """
         Generate a random Codenames board.
 
+        Randomness comes from a private random.Random rather than the
+        global RNG, so boards can be generated from several threads and
+        callers' own use of the random module is left untouched.
+
         Args:
             starting_team: Which team goes first (and has 9 words)
             seed: Random seed for reproducibility
+            rng: Random instance to draw from (ignored when seed is given)
 
         Returns:
             A new GameState with randomized board and key
         """
-        if seed is not None:
-            random.seed(seed)
+        if seed is not None or rng is None:
+            rng = random.Random(seed)
 
         # Select 25 random words
-        words = random.sample(self.word_list, self.TOTAL_CARDS)
+        words = rng.sample(self.word_list, self.TOTAL_CARDS)
 
         # Generate key card
         key = self._generate_key(starting_team)
 
-        # Shuffle the key to randomize positions
-        combined = list(zip(words, key))
-        random.shuffle(combined)
-        words, key = zip(*combined)
-        words = list(words)
-        key = list(key)
+        # Shuffle words and key by the same permutation (shuffle draws the
+        # same random numbers for any 25-item list, so seeded boards match
+        # the old zip-and-shuffle output)
+        perm = list(range(self.TOTAL_CARDS))
+        rng.shuffle(perm)
+        words = [words[i] for i in perm]
+        key = [key[i] for i in perm]
 
         # Initial game state
         return GameState(
@@ -99,23 +220,17 @@ class BoardGenerator:
         Returns:
             List of CardTypes in order (to be shuffled with words)
         """
-        key: list[CardType] = []
-
-        # Starting team gets 9 words
-        starting_type = CardType.for_team(starting_team)
-        key.extend([starting_type] * self.STARTING_TEAM_WORDS)
-
-        # Other team gets 8 words
-        other_type = CardType.for_team(starting_team.opponent)
-        key.extend([other_type] * self.OTHER_TEAM_WORDS)
-
-        # Neutral words
-        key.extend([CardType.NEUTRAL] * self.NEUTRAL_WORDS)
-
-        # Assassin
-        key.extend([CardType.ASSASSIN] * self.ASSASSIN_WORDS)
-
-        return key
+        return list(self._key_templates[starting_team])
+
+    def _build_key(self, starting_team: Team) -> tuple[CardType, ...]:
+        """Build the unshuffled key for a starting team."""
+        return (
+            # Starting team gets 9 words, other team gets 8
+            (CardType.for_team(starting_team),) * self.STARTING_TEAM_WORDS
+            + (CardType.for_team(starting_team.opponent),) * self.OTHER_TEAM_WORDS
+            + (CardType.NEUTRAL,) * self.NEUTRAL_WORDS
+            + (CardType.ASSASSIN,) * self.ASSASSIN_WORDS
+        )
 
     def generate_board_set(
         self,
@@ -135,7 +250,32 @@ class BoardGenerator:
         Returns:
             List of GameState objects
         """
-        boards = []
+        return list(self.iter_board_set(count, starting_team, base_seed))
+
+    def iter_board_set(
+        self,
+        count: int,
+        starting_team: Optional[Team] = None,
+        base_seed: Optional[int] = None
+    ) -> Iterator[GameState]:
+        """
+        Lazily generate a set of boards (see generate_board_set).
+
+        Lets large sets be written out as they are generated instead of
+        being built in memory first.
+
+        Args:
+            count: Number of boards to generate
+            starting_team: If specified, all boards start with this team.
+                          If None, alternates between RED and BLUE.
+            base_seed: If specified, uses deterministic seeds for reproducibility
+
+        Yields:
+            GameState objects
+        """
+        # Unseeded sets draw every board from one RNG instead of reseeding
+        rng = random.Random() if base_seed is None else None
+
         for i in range(count):
             seed = base_seed + i if base_seed is not None else None
 
@@ -145,42 +285,65 @@ class BoardGenerator:
                 # Alternate starting teams
                 team = Team.RED if i % 2 == 0 else Team.BLUE
 
-            board = self.generate_board(starting_team=team, seed=seed)
-            boards.append(board)
+            yield self.generate_board(starting_team=team, seed=seed, rng=rng)
 
-        return boards
+    @staticmethod
+    def _board_to_dict(board: GameState) -> dict:
+        """Serialize a board's starting configuration."""
+        return {
+            "words": board.words,
+            "key": [ct.value for ct in board.key],
+            "starting_team": board.current_team.value,
+            "red_remaining": board.red_remaining,
+            "blue_remaining": board.blue_remaining,
+        }
+
+    @staticmethod
+    def _board_from_dict(board_data: dict) -> GameState:
+        """Build a fresh game state from a serialized board."""
+        return GameState(
+            words=[sys.intern(w) for w in board_data["words"]],
+            key=[CardType(ct) for ct in board_data["key"]],
+            revealed=[False] * 25,
+            current_team=Team(board_data["starting_team"]),
+            red_remaining=board_data["red_remaining"],
+            blue_remaining=board_data["blue_remaining"],
+        )
 
     @staticmethod
-    def save_boards(boards: list[GameState], filepath: Path) -> None:
+    def save_boards(boards: Iterable[GameState], filepath: Path) -> None:
         """
         Save a list of boards to a JSON file.
 
+        Files with a .jsonl suffix are written with one board per line as
+        the boards are produced, so a generator can be passed in; they can
+        be streamed back with iter_boards.
+
         Args:
-            boards: List of GameState objects to save
+            boards: GameState objects to save
             filepath: Path to save the JSON file
         """
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        if filepath.suffix == ".jsonl":
+            with open(filepath, "wb") as f:
+                for board in boards:
+                    f.write(jsonio.dumps(BoardGenerator._board_to_dict(board)) + b"\n")
+            return
+
+        boards = list(boards)
         data = {
             "count": len(boards),
-            "boards": [
-                {
-                    "words": board.words,
-                    "key": [ct.value for ct in board.key],
-                    "starting_team": board.current_team.value,
-                    "red_remaining": board.red_remaining,
-                    "blue_remaining": board.blue_remaining,
-                }
-                for board in boards
-            ]
+            "boards": [BoardGenerator._board_to_dict(board) for board in boards],
         }
 
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(jsonio.dumps(data, indent=True))
 
     @staticmethod
     def load_boards(filepath: Path) -> list[GameState]:
         """
-        Load boards from a JSON file.
+        Load boards from a JSON or JSONL file.
 
         Args:
             filepath: Path to the JSON file
@@ -188,19 +351,47 @@ class BoardGenerator:
         Returns:
             List of GameState objects
         """
-        with open(filepath) as f:
-            data = json.load(f)
+        return list(BoardGenerator.iter_boards(filepath))
 
-        boards = []
-        for board_data in data["boards"]:
-            state = GameState(
-                words=board_data["words"],
-                key=[CardType(ct) for ct in board_data["key"]],
-                revealed=[False] * 25,
-                current_team=Team(board_data["starting_team"]),
-                red_remaining=board_data["red_remaining"],
-                blue_remaining=board_data["blue_remaining"],
-            )
-            boards.append(state)
+    @staticmethod
+    def load_board_batch(filepath: Path, max_boards: Optional[int] = None) -> BoardBatch:
+        """
+        Load boards from a JSON or JSONL file into a columnar BoardBatch.
+
+        Args:
+            filepath: Path to the board file
+            max_boards: Only load the first max_boards boards
+
+        Returns:
+            BoardBatch in file order
+        """
+        return BoardBatch.from_states(
+            islice(BoardGenerator.iter_boards(filepath), max_boards or None)
+        )
 
-        return boards
+    @staticmethod
+    def iter_boards(filepath: Path) -> Iterator[GameState]:
+        """
+        Iterate over boards in a JSON or JSONL file.
+
+        JSONL files are read and parsed one line at a time, so only the
+        boards consumed so far are held in memory.
+
+        Args:
+            filepath: Path to the board file
+
+        Yields:
+            GameState objects in file order
+        """
+        if Path(filepath).suffix == ".jsonl":
+            with open(filepath, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        yield BoardGenerator._board_from_dict(jsonio.loads(line))
+            return
+
+        with open(filepath, "rb") as f:
+            data = jsonio.loads(f.read())
+
+        for board_data in data["boards"]:
+            yield BoardGenerator._board_from_dict(board_data)
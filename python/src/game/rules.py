@@ -6,7 +6,7 @@ from typing import Optional
 from .state import GameState, Team, CardType, Clue, GuessResult
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnResult:
     """Result of processing a complete turn."""
     guesses: list[GuessResult]
@@ -50,15 +50,13 @@ class GameRules:
             raise ValueError(f"It's {state.current_team.value}'s turn, not {clue.team.value}'s")
 
         # Validate clue word isn't on the board
-        clue_word_upper = clue.word.upper()
-        for word in state.words:
-            if word.upper() == clue_word_upper:
-                raise ValueError(f"Clue word '{clue.word}' is on the board")
+        if state.get_word_index(clue.word) is not None:
+            raise ValueError(f"Clue word '{clue.word}' is on the board")
 
         new_state = state.copy()
         new_state.current_clue = clue
         new_state.guesses_remaining = clue.number + 1  # Can guess number + 1 times
-        new_state.clue_history.append(clue)
+        new_state.record_clue(clue)
         return new_state
 
     @staticmethod
@@ -73,6 +71,13 @@ class GameRules:
         Returns:
             Tuple of (new game state, result of the guess)
         """
+        word_index = GameRules._validate_guess(state, word)
+        new_state = state.copy()
+        return new_state, GameRules._apply_guess(new_state, word_index, word)
+
+    @staticmethod
+    def _validate_guess(state: GameState, word: str) -> int:
+        """Check a guess is allowed and return the guessed word's board index."""
         if state.game_over:
             raise ValueError("Cannot guess - game is over")
         if state.current_clue is None:
@@ -81,53 +86,51 @@ class GameRules:
             raise ValueError("No guesses remaining this turn")
 
         # Find the word on the board
-        word_upper = word.upper()
-        word_index = None
-        for i, w in enumerate(state.words):
-            if w.upper() == word_upper:
-                word_index = i
-                break
-
+        word_index = state.get_word_index(word)
         if word_index is None:
             raise ValueError(f"Word '{word}' not found on board")
 
         if state.revealed[word_index]:
             raise ValueError(f"Word '{word}' has already been revealed")
 
+        return word_index
+
+    @staticmethod
+    def _apply_guess(state: GameState, word_index: int, word: str) -> GuessResult:
+        """Apply a validated guess to the state in place."""
         # Reveal the card
-        new_state = state.copy()
-        new_state.revealed[word_index] = True
+        state.revealed[word_index] = True
         card_type = state.key[word_index]
 
         # Update remaining counts
-        if card_type == CardType.RED:
-            new_state.red_remaining -= 1
-        elif card_type == CardType.BLUE:
-            new_state.blue_remaining -= 1
+        if card_type is CardType.RED:
+            state.red_remaining -= 1
+        elif card_type is CardType.BLUE:
+            state.blue_remaining -= 1
 
         # Record guess
-        new_state.guess_history.append((word, card_type))
+        state.record_guess(word, card_type)
 
         # Determine result
-        current_team_type = CardType.for_team(state.current_team)
-        correct = card_type == current_team_type
+        guessing_team = state.current_team
+        correct = card_type is CardType.for_team(guessing_team)
 
         # Check for game end conditions
         game_over = False
         winner = None
         turn_ended = False
 
-        if card_type == CardType.ASSASSIN:
+        if card_type is CardType.ASSASSIN:
             # Assassin - guessing team loses
             game_over = True
-            winner = state.current_team.opponent
+            winner = guessing_team.opponent
             turn_ended = True
-        elif new_state.red_remaining == 0:
+        elif state.red_remaining == 0:
             # Red found all their words
             game_over = True
             winner = Team.RED
             turn_ended = True
-        elif new_state.blue_remaining == 0:
+        elif state.blue_remaining == 0:
             # Blue found all their words
             game_over = True
             winner = Team.BLUE
@@ -137,18 +140,18 @@ class GameRules:
             turn_ended = True
         else:
             # Correct guess - use one guess
-            new_state.guesses_remaining -= 1
-            if new_state.guesses_remaining <= 0:
+            state.guesses_remaining -= 1
+            if state.guesses_remaining <= 0:
                 turn_ended = True
 
         if game_over:
-            new_state.game_over = True
-            new_state.winner = winner
+            state.game_over = True
+            state.winner = winner
 
         if turn_ended and not game_over:
-            new_state = GameRules.end_turn(new_state)
+            GameRules._end_turn_in_place(state)
 
-        return new_state, GuessResult(
+        return GuessResult(
             word=word,
             card_type=card_type,
             correct=correct,
@@ -172,11 +175,16 @@ class GameRules:
             return state
 
         new_state = state.copy()
-        new_state.current_team = state.current_team.opponent
-        new_state.current_clue = None
-        new_state.guesses_remaining = 0
+        GameRules._end_turn_in_place(new_state)
         return new_state
 
+    @staticmethod
+    def _end_turn_in_place(state: GameState) -> None:
+        """Switch to the other team without copying the state."""
+        state.current_team = state.current_team.opponent
+        state.current_clue = None
+        state.guesses_remaining = 0
+
     @staticmethod
     def pass_turn(state: GameState) -> GameState:
         """
@@ -212,28 +220,31 @@ class GameRules:
         results: list[GuessResult] = []
         team_words_found = 0
         turn_ended_by = "limit"
-        current_state = state
+
+        # Copy once up front and apply every guess to the copy in place
+        current_state = state.copy()
 
         for guess in guesses:
             if current_state.game_over or current_state.guesses_remaining <= 0:
                 break
 
             try:
-                current_state, result = GameRules.make_guess(current_state, guess)
+                word_index = GameRules._validate_guess(current_state, guess)
+                result = GameRules._apply_guess(current_state, word_index, guess)
                 results.append(result)
 
                 if result.correct:
                     team_words_found += 1
 
                 if result.game_over:
-                    if result.card_type == CardType.ASSASSIN:
+                    if result.card_type is CardType.ASSASSIN:
                         turn_ended_by = "assassin"
                     else:
                         turn_ended_by = "win"
                     break
 
                 if result.turn_ended:
-                    if result.card_type == CardType.NEUTRAL:
+                    if result.card_type is CardType.NEUTRAL:
                         turn_ended_by = "neutral"
                     else:
                         turn_ended_by = "opponent"
@@ -246,7 +257,7 @@ class GameRules:
         # If the turn wasn't already ended (by neutral/opponent/assassin/win),
         # we need to end it now (either used all guesses or ran out of words to guess)
         if not current_state.game_over and current_state.current_clue is not None:
-            current_state = GameRules.end_turn(current_state)
+            GameRules._end_turn_in_place(current_state)
 
         return current_state, TurnResult(
             guesses=results,
@@ -1,5 +1,6 @@
 """Game state types and data structures for Codenames."""
 
+import sys
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import Optional
@@ -13,7 +14,7 @@ class Team(Enum):
     @property
     def opponent(self) -> "Team":
         """Get the opposing team."""
-        return Team.BLUE if self == Team.RED else Team.RED
+        return _OPPONENTS[self]
 
 
 class CardType(Enum):
@@ -26,10 +27,16 @@ class CardType(Enum):
     @classmethod
     def for_team(cls, team: Team) -> "CardType":
         """Get the card type for a team."""
-        return cls.RED if team == Team.RED else cls.BLUE
+        return _TEAM_CARD_TYPES[team]
 
 
-@dataclass
+# Lookup tables behind Team.opponent and CardType.for_team, which are
+# called on every turn and rollout
+_OPPONENTS = {Team.RED: Team.BLUE, Team.BLUE: Team.RED}
+_TEAM_CARD_TYPES = {Team.RED: CardType.RED, Team.BLUE: CardType.BLUE}
+
+
+@dataclass(slots=True)
 class Card:
     """A single card on the board."""
     word: str
@@ -41,7 +48,7 @@ class Card:
         return Card(word=self.word, card_type=self.card_type, revealed=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class Clue:
     """A clue given by a spymaster."""
     word: str
@@ -50,7 +57,7 @@ class Clue:
     intended_targets: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GuessResult:
     """Result of a single guess."""
     word: str
@@ -61,10 +68,10 @@ class GuessResult:
     winner: Optional[Team] = None  # If game_over, who won
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Complete state of a Codenames game."""
-    # Board configuration
+    # Board configuration (fixed for the game; shared between copies)
     words: list[str]  # 25 words in order (5x5 grid, row-major)
     key: list[CardType]  # Card types for each position
 
@@ -85,12 +92,49 @@ class GameState:
     # History
     clue_history: list[Clue] = field(default_factory=list)
     guess_history: list[tuple[str, CardType]] = field(default_factory=list)
+    # Set while a history list is shared with a copy; it is copied before
+    # this state appends to it (see record_clue / record_guess)
+    _clue_history_shared: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+    _guess_history_shared: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+
+    # Derived lookups (words and key never change during a game)
+    _word_index: Optional[dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _type_indices: Optional[dict[CardType, tuple[int, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def starting_team(self) -> Team:
         """The team that goes first (has 9 words)."""
         return Team.RED if self.red_remaining >= self.blue_remaining else Team.BLUE
 
+    def get_word_index(self, word: str) -> Optional[int]:
+        """Get the board position of a word (case-insensitive), or None."""
+        if self._word_index is None:
+            self._word_index = {
+                sys.intern(w.upper()): i for i, w in enumerate(self.words)
+            }
+        # Interned, already-uppercase words hit on identity without re-casing
+        index = self._word_index.get(word)
+        if index is None:
+            index = self._word_index.get(word.upper())
+        return index
+
+    def get_type_indices(self, card_type: CardType) -> tuple[int, ...]:
+        """Get the board positions holding a card type."""
+        if self._type_indices is None:
+            indices: dict[CardType, list[int]] = {t: [] for t in CardType}
+            for i, t in enumerate(self.key):
+                indices[t].append(i)
+            self._type_indices = {t: tuple(idx) for t, idx in indices.items()}
+        return self._type_indices[card_type]
+
     def get_card(self, index: int) -> Card:
         """Get the card at a given index."""
         return Card(
@@ -101,11 +145,10 @@ class GameState:
 
     def get_card_by_word(self, word: str) -> Optional[Card]:
         """Get a card by its word."""
-        word_upper = word.upper()
-        for i, w in enumerate(self.words):
-            if w.upper() == word_upper:
-                return self.get_card(i)
-        return None
+        index = self.get_word_index(word)
+        if index is None:
+            return None
+        return self.get_card(index)
 
     def get_unrevealed_words(self) -> list[str]:
         """Get list of words that haven't been revealed yet."""
@@ -113,25 +156,40 @@ class GameState:
 
     def get_team_words(self, team: Team, revealed_only: bool = False) -> list[str]:
         """Get words belonging to a team."""
-        card_type = CardType.for_team(team)
+        words, revealed = self.words, self.revealed
         return [
-            w for w, t, r in zip(self.words, self.key, self.revealed)
-            if t == card_type and (not revealed_only or r)
+            words[i] for i in self.get_type_indices(CardType.for_team(team))
+            if not revealed_only or revealed[i]
         ]
 
     def get_remaining_words(self, team: Team) -> list[str]:
         """Get unrevealed words belonging to a team."""
-        card_type = CardType.for_team(team)
+        words, revealed = self.words, self.revealed
         return [
-            w for w, t, r in zip(self.words, self.key, self.revealed)
-            if t == card_type and not r
+            words[i] for i in self.get_type_indices(CardType.for_team(team))
+            if not revealed[i]
         ]
 
+    def fingerprint(self) -> tuple:
+        """
+        Get a hashable key for the board position.
+
+        Covers the words, key and revealed cards, which is everything a
+        spymaster sees; turn bookkeeping and history are not included.
+        """
+        return (tuple(self.words), tuple(self.key), tuple(self.revealed))
+
     def copy(self) -> "GameState":
-        """Create a deep copy of the game state."""
-        return GameState(
-            words=self.words.copy(),
-            key=self.key.copy(),
+        """
+        Create a copy of the game state.
+
+        Mutable game progress is copied; the board words and key never
+        change during a game, so the copy shares them with this state.
+        The history lists are shared until either state records to them.
+        """
+        new_state = GameState(
+            words=self.words,
+            key=self.key,
             revealed=self.revealed.copy(),
             current_team=self.current_team,
             current_clue=self.current_clue,
@@ -140,6 +198,27 @@ class GameState:
             blue_remaining=self.blue_remaining,
             game_over=self.game_over,
             winner=self.winner,
-            clue_history=self.clue_history.copy(),
-            guess_history=self.guess_history.copy(),
+            clue_history=self.clue_history,
+            guess_history=self.guess_history,
         )
+        # Board lookups depend only on words/key, so they are shared too
+        new_state._word_index = self._word_index
+        new_state._type_indices = self._type_indices
+        # Histories are copied on write, by whichever state appends first
+        self._clue_history_shared = new_state._clue_history_shared = True
+        self._guess_history_shared = new_state._guess_history_shared = True
+        return new_state
+
+    def record_clue(self, clue: Clue) -> None:
+        """Append a clue to this state's clue history."""
+        if self._clue_history_shared:
+            self.clue_history = self.clue_history.copy()
+            self._clue_history_shared = False
+        self.clue_history.append(clue)
+
+    def record_guess(self, word: str, card_type: CardType) -> None:
+        """Append a guess to this state's guess history."""
+        if self._guess_history_shared:
+            self.guess_history = self.guess_history.copy()
+            self._guess_history_shared = False
+        self.guess_history.append((word, card_type))
@@ -1,25 +1,29 @@
 """Guesser LLM interface using OpenAI Structured Outputs."""
 
-import json
+import sys
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from openai import AsyncOpenAI
 
+from .. import jsonio
 from ..game import GameState, Team, Clue
+from ..llm import ResponseCache, StructuredClient, make_client
 from ..paths import PROMPTS_DIR
-from .schema_builder import build_guesser_schema
+from ..prompts import bullet_list, load_prompt
+from .schema_builder import build_guesser_schema, build_simple_guesser_schema
 
 
-@dataclass
+@dataclass(slots=True)
 class Guess:
     """A single guess with confidence score."""
     word: str
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GuesserOutput:
     """Complete output from the guesser."""
     guesses: list[Guess]
@@ -27,12 +31,17 @@ class GuesserOutput:
     stop_after: int  # 0 means use all guesses allowed
 
 
+# Sort key for guesses (C-level attribute access instead of a lambda)
+_by_confidence = attrgetter("confidence")
+
+
 @dataclass
 class GuesserConfig:
     """Configuration for the guesser."""
     model: str = "gpt-4o-mini"
     prompt_id: str = "guesser_v1"
     temperature: float = 0.2
+    enum_schema: bool = True  # Constrain words to the board via a schema enum
 
 
 class Guesser:
@@ -43,7 +52,9 @@ class Guesser:
     returns an ordered list of guesses with confidence scores.
 
     Key feature: The JSON Schema dynamically includes only unrevealed
-    words as valid options, preventing hallucinated guesses.
+    words as valid options, preventing hallucinated guesses. With
+    enum_schema disabled, a board-independent schema is sent instead
+    (fewer input tokens) and guesses are checked against the board locally.
     """
 
     def __init__(
@@ -51,46 +62,48 @@ class Guesser:
         config: GuesserConfig,
         client: Optional[AsyncOpenAI] = None,
         prompts_dir: Optional[Path] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize the guesser.
 
         Args:
             config: Guesser configuration
-            client: OpenAI client (creates one if not provided)
+            client: OpenAI client (make_client() if not provided)
             prompts_dir: Directory containing prompt templates
+            cache: Response cache for deterministic requests
         """
         self.config = config
-        self.client = client or AsyncOpenAI()
+        self.client = client or make_client()
+        self.llm = StructuredClient(self.client, cache)
 
         if prompts_dir is None:
             prompts_dir = PROMPTS_DIR
         self.prompts_dir = prompts_dir
 
-        self._prompt_template = self._load_prompt()
+        self._render_prompt = self._load_prompt()
 
-    def _load_prompt(self) -> str:
-        """Load the prompt template."""
-        prompt_file = self.prompts_dir / f"{self.config.prompt_id}.txt"
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
-        return prompt_file.read_text()
+    def _load_prompt(self) -> Callable[..., str]:
+        """Load the prompt template's renderer."""
+        return load_prompt(self.prompts_dir / f"{self.config.prompt_id}.txt")
 
     def _format_prompt(
         self,
         state: GameState,
         clue: Clue,
+        unrevealed: Optional[list[str]] = None,
     ) -> str:
         """Format the prompt with game state information."""
-        unrevealed = state.get_unrevealed_words()
+        if unrevealed is None:
+            unrevealed = state.get_unrevealed_words()
 
-        return self._prompt_template.format(
+        return self._render_prompt(
             team=clue.team.value.upper(),
             team_remaining=state.red_remaining if clue.team == Team.RED else state.blue_remaining,
             opponent_remaining=state.blue_remaining if clue.team == Team.RED else state.red_remaining,
             clue=clue.word,
             number=clue.number,
-            unrevealed_words="\n".join(f"- {w}" for w in unrevealed),
+            unrevealed_words=bullet_list(unrevealed),
         )
 
     async def get_guesses(
@@ -110,29 +123,63 @@ class Guesser:
         Returns:
             GuesserOutput with ordered guesses and reasoning
         """
-        unrevealed = state.get_unrevealed_words()
-        prompt = self._format_prompt(state, clue)
-        schema = build_guesser_schema(unrevealed)
+        request = self.build_request(state, clue, temperature)
+        return (await self.complete(request))[0]
 
-        response = await self.client.chat.completions.create(
-            model=self.config.model,
-            messages=[
+    def build_request(
+        self,
+        state: GameState,
+        clue: Clue,
+        temperature: Optional[float] = None,
+    ) -> dict:
+        """
+        Build the chat completion request body for a guess.
+
+        Args:
+            state: Current game state
+            clue: The clue to respond to
+            temperature: Override temperature (uses config if not specified)
+
+        Returns:
+            Keyword arguments for client.chat.completions.create
+        """
+        unrevealed = state.get_unrevealed_words()
+        prompt = self._format_prompt(state, clue, unrevealed)
+        if self.config.enum_schema:
+            schema = build_guesser_schema(unrevealed)
+        else:
+            schema = build_simple_guesser_schema()
+
+        return {
+            "model": self.config.model,
+            "messages": [
                 {"role": "user", "content": prompt}
             ],
-            temperature=temperature or self.config.temperature,
-            response_format={
+            "temperature": temperature or self.config.temperature,
+            "response_format": {
                 "type": "json_schema",
                 "json_schema": schema,
             },
-        )
+        }
+
+    def parse_content(self, content: str) -> GuesserOutput:
+        """
+        Parse the JSON content of a guesser response.
+
+        Repeated words are collapsed in the same pass, keeping the highest
+        confidence, so a duplicate can't take up one of the turn's guesses.
+        """
+        data = jsonio.loads_object(content)
 
-        # Parse the structured response
-        content = response.choices[0].message.content
-        data = json.loads(content)
+        confidences: dict[str, float] = {}
+        for g in data["guesses"]:
+            word, confidence = sys.intern(g["word"]), g["confidence"]
+            if word not in confidences or confidence > confidences[word]:
+                confidences[word] = confidence
 
         guesses = [
-            Guess(word=g["word"], confidence=g["confidence"])
-            for g in data["guesses"]
+            Guess(word=word, confidence=confidence)
+            for word, confidence in confidences.items()
         ]
 
         return GuesserOutput(
@@ -151,6 +198,9 @@ class Guesser:
         """
         Get multiple independent guess sets (for evaluation).
 
+        All samples come from a single request with n choices, so the
+        prompt is only sent and billed once.
+
         Args:
             state: Current game state
             clue: The clue to respond to
@@ -160,34 +210,69 @@ class Guesser:
         Returns:
             List of GuesserOutput objects
         """
-        import asyncio
+        request = self.build_request(state, clue, temperature)
+        return await self.complete(request, n)
 
-        tasks = [
-            self.get_guesses(state, clue, temperature)
-            for _ in range(n)
-        ]
-        return await asyncio.gather(*tasks)
+    async def complete(self, request: dict, n: int = 1) -> list[GuesserOutput]:
+        """
+        Run a prebuilt guesser request (see build_request).
+
+        Building the request once and completing it several times avoids
+        re-rendering the prompt and schema for repeated samples.
 
-    def get_ordered_words(self, output: GuesserOutput, limit: Optional[int] = None) -> list[str]:
+        Args:
+            request: Request from build_request
+            n: Number of choices to sample from the single request
+
+        Returns:
+            List of n GuesserOutput objects
+        """
+        contents = await self.llm.create_json_choices(request, n)
+        return [self.parse_content(content) for content in contents]
+
+    def get_ordered_words(
+        self,
+        output: GuesserOutput,
+        limit: Optional[int] = None,
+        state: Optional[GameState] = None,
+    ) -> list[str]:
         """
         Extract ordered word list from guesser output.
 
         Args:
             output: GuesserOutput from get_guesses
             limit: Maximum number of words to return
+            state: Board being guessed on; with enum_schema disabled, words
+                that aren't unrevealed board words are dropped before the
+                limit is applied
 
         Returns:
             List of words in order of confidence
         """
         # Sort by confidence descending
-        sorted_guesses = sorted(output.guesses, key=lambda g: g.confidence, reverse=True)
+        sorted_guesses = sorted(output.guesses, key=_by_confidence, reverse=True)
 
-        # Apply stop_after recommendation if set
-        if output.stop_after > 0:
-            sorted_guesses = sorted_guesses[:output.stop_after]
+        if state is not None and not self.config.enum_schema:
+            sorted_guesses = self._on_board(sorted_guesses, state)
 
-        # Apply limit
+        # Apply stop_after recommendation and limit as a single cutoff
+        cutoff = len(sorted_guesses)
+        if output.stop_after > 0:
+            cutoff = min(cutoff, output.stop_after)
         if limit is not None:
-            sorted_guesses = sorted_guesses[:limit]
-
-        return [g.word for g in sorted_guesses]
+            cutoff = min(cutoff, limit)
+
+        return [g.word for g in sorted_guesses[:cutoff]]
+
+    @staticmethod
+    def _on_board(guesses: list[Guess], state: GameState) -> list[Guess]:
+        """Keep guesses naming unrevealed board words, in board spelling."""
+        valid = []
+        seen = set()
+        for g in guesses:
+            index = state.get_word_index(g.word)
+            if index is None or state.revealed[index] or index in seen:
+                continue
+            seen.add(index)
+            valid.append(Guess(word=state.words[index], confidence=g.confidence))
+        return valid
@@ -1,21 +1,25 @@
 """Dynamic JSON Schema builder for guesser structured outputs."""
 
+from functools import lru_cache
 from typing import Any
 
+# Sub-schemas that don't depend on the board, shared by every schema built
+_REASONING = {
+    "type": "string",
+    "description": "Brief explanation of the guessing strategy"
+}
+_CONFIDENCE = {
+    "type": "number",
+    "description": "Confidence score between 0 and 1"
+}
+_STOP_AFTER = {
+    "type": "integer",
+    "description": "Recommended number of guesses before stopping (0 means use all)"
+}
 
-def build_guesser_schema(unrevealed_words: list[str]) -> dict[str, Any]:
-    """
-    Build a JSON Schema for guesser output with dynamic enum of unrevealed words.
-
-    This schema is used with OpenAI's Structured Outputs feature to ensure
-    the guesser can only output valid, unrevealed board words.
-
-    Args:
-        unrevealed_words: List of words currently unrevealed on the board
 
-    Returns:
-        JSON Schema dict suitable for OpenAI's response_format
-    """
+def _wrap(word_schema: dict[str, Any]) -> dict[str, Any]:
+    """Build the full response_format schema around a word sub-schema."""
     return {
         "name": "guesser_output",
         "strict": True,
@@ -24,10 +28,7 @@ def build_guesser_schema(unrevealed_words: list[str]) -> dict[str, Any]:
             "required": ["reasoning", "guesses", "stop_after"],
             "additionalProperties": False,
             "properties": {
-                "reasoning": {
-                    "type": "string",
-                    "description": "Brief explanation of the guessing strategy"
-                },
+                "reasoning": _REASONING,
                 "guesses": {
                     "type": "array",
                     "description": "Ordered list of guesses from most to least confident",
@@ -36,72 +37,59 @@ def build_guesser_schema(unrevealed_words: list[str]) -> dict[str, Any]:
                         "required": ["word", "confidence"],
                         "additionalProperties": False,
                         "properties": {
-                            "word": {
-                                "type": "string",
-                                "enum": unrevealed_words,
-                                "description": "The word being guessed"
-                            },
-                            "confidence": {
-                                "type": "number",
-                                "description": "Confidence score between 0 and 1"
-                            }
+                            "word": word_schema,
+                            "confidence": _CONFIDENCE,
                         }
                     }
                 },
-                "stop_after": {
-                    "type": "integer",
-                    "description": "Recommended number of guesses before stopping (0 means use all)"
-                }
+                "stop_after": _STOP_AFTER,
             }
         }
     }
 
 
+@lru_cache(maxsize=256)
+def _cached_guesser_schema(unrevealed_words: tuple[str, ...]) -> dict[str, Any]:
+    return _wrap({
+        "type": "string",
+        "enum": list(unrevealed_words),
+        "description": "The word being guessed"
+    })
+
+
+_SIMPLE_GUESSER_SCHEMA = _wrap({
+    "type": "string",
+    "description": "The word being guessed (must be on the board)"
+})
+
+
+def build_guesser_schema(unrevealed_words: list[str]) -> dict[str, Any]:
+    """
+    Build a JSON Schema for guesser output with dynamic enum of unrevealed words.
+
+    This schema is used with OpenAI's Structured Outputs feature to ensure
+    the guesser can only output valid, unrevealed board words. Schemas are
+    memoized per word list and shared between callers, so treat the result
+    as read-only.
+
+    Args:
+        unrevealed_words: List of words currently unrevealed on the board
+
+    Returns:
+        JSON Schema dict suitable for OpenAI's response_format
+    """
+    return _cached_guesser_schema(tuple(unrevealed_words))
+
+
 def build_simple_guesser_schema() -> dict[str, Any]:
     """
     Build a simpler schema without enum constraint.
 
     Use this when you want to allow any word (e.g., for testing or
-    when the enum constraint causes issues).
+    when the enum constraint causes issues). The schema is a shared
+    constant, so treat it as read-only.
 
     Returns:
         JSON Schema dict suitable for OpenAI's response_format
     """
-    return {
-        "name": "guesser_output",
-        "strict": True,
-        "schema": {
-            "type": "object",
-            "required": ["reasoning", "guesses", "stop_after"],
-            "additionalProperties": False,
-            "properties": {
-                "reasoning": {
-                    "type": "string",
-                    "description": "Brief explanation of the guessing strategy"
-                },
-                "guesses": {
-                    "type": "array",
-                    "description": "Ordered list of guesses from most to least confident",
-                    "items": {
-                        "type": "object",
-                        "required": ["word", "confidence"],
-                        "additionalProperties": False,
-                        "properties": {
-                            "word": {
-                                "type": "string",
-                                "description": "The word being guessed (must be on the board)"
-                            },
-                            "confidence": {
-                                "type": "number",
-                                "description": "Confidence score between 0 and 1"
-                            }
-                        }
-                    }
-                },
-                "stop_after": {
-                    "type": "integer",
-                    "description": "Recommended number of guesses before stopping (0 means use all)"
-                }
-            }
-        }
-    }
+    return _SIMPLE_GUESSER_SCHEMA
@@ -0,0 +1,114 @@
+"""Fast JSON encoding/decoding with an optional orjson backend."""
+
+import json
+import re
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# Tokens that matter when locating an object: escapes, quotes and braces
+_OBJECT_TOKENS = re.compile(r'\\.|["{}]', re.DOTALL)
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation instead of compact output
+        sort_keys: Sort object keys, for a canonical encoding
+
+    Returns:
+        UTF-8 encoded JSON (no trailing newline)
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys).encode("utf-8")
+    return json.dumps(
+        obj, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def find_object(text: str) -> Optional[tuple[int, int]]:
+    """
+    Locate the first balanced JSON object in a string.
+
+    Braces inside string literals (including escaped quotes) are ignored,
+    so the scan is a single linear pass over the text.
+
+    Args:
+        text: Text that may contain a JSON object among other content
+
+    Returns:
+        (start, end) slice bounds of the object, or None if there is none
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    for match in _OBJECT_TOKENS.finditer(text, start):
+        token = match.group()
+        if token == '"':
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return start, match.end()
+    return None
+
+
+def loads_object(data: str | bytes) -> Any:
+    """
+    Parse a JSON object, salvaging it from surrounding text if needed.
+
+    Model output occasionally wraps the object in prose or code fences;
+    if the text doesn't parse as-is, the first balanced object is parsed.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        ValueError: If no JSON object can be parsed
+    """
+    try:
+        return loads(data)
+    except ValueError:
+        text = data.decode("utf-8") if isinstance(data, bytes) else data
+        bounds = find_object(text)
+        if bounds is None:
+            raise
+        return loads(text[bounds[0]:bounds[1]])
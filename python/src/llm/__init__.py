@@ -0,0 +1,9 @@
+# LLM client module
+from .cache import ResponseCache
+from .client import StructuredClient, make_client
+
+__all__ = [
+    "ResponseCache",
+    "StructuredClient",
+    "make_client",
+]
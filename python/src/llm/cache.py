@@ -0,0 +1,324 @@
+"""Content-addressed cache for LLM responses."""
+
+import asyncio
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+
+# Cache keys aren't a security boundary; this also keeps the hash
+# available on FIPS-restricted OpenSSL builds. The algorithm is fixed
+# (not picked by installed extras) so cache files are portable.
+_hash = functools.partial(hashlib.sha256, usedforsecurity=False)
+
+
+def _canonical(obj) -> bytes:
+    """
+    Encode an object as canonical JSON for hashing.
+
+    Always the stdlib encoder: orjson formats some floats differently
+    (e.g. 1e-05), which would make keys depend on the installed extras.
+    """
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on installed extras
+    zstandard = None
+
+# Digests of response schemas keyed by id. Schemas are memoized by their
+# builders, so one object recurs across many requests; the object is held
+# alongside its digest so the id can't be reused while the entry exists.
+_SCHEMA_DIGESTS: dict[int, tuple[dict, str]] = {}
+_SCHEMA_DIGESTS_MAX = 1024
+
+
+def _schema_digest(schema: dict) -> str:
+    """Get the (memoized) digest of a response schema."""
+    entry = _SCHEMA_DIGESTS.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    digest = _hash(_canonical(schema)).hexdigest()
+    if len(_SCHEMA_DIGESTS) >= _SCHEMA_DIGESTS_MAX:
+        _SCHEMA_DIGESTS.clear()
+    _SCHEMA_DIGESTS[id(schema)] = (schema, digest)
+    return digest
+
+
+# Values shorter than this are stored as plain text; compression wouldn't pay
+_COMPRESS_MIN_BYTES = 256
+
+# One-byte codec tags prefixed to compressed (BLOB) values
+_ZSTD = b"z"
+_ZLIB = b"d"
+
+
+def _encode(value: str) -> Union[str, bytes]:
+    """Compress a value for storage (zstd if installed, else zlib)."""
+    data = value.encode("utf-8")
+    if len(data) < _COMPRESS_MIN_BYTES:
+        return value
+    if zstandard is not None:
+        return _ZSTD + zstandard.ZstdCompressor(level=3).compress(data)
+    return _ZLIB + zlib.compress(data, 6)
+
+
+def _decode(stored: Union[str, bytes]) -> Optional[str]:
+    """Decode a stored value; None if it needs a codec that isn't installed."""
+    if isinstance(stored, str):
+        return stored
+    codec, payload = stored[:1], stored[1:]
+    if codec == _ZLIB:
+        return zlib.decompress(payload).decode("utf-8")
+    if codec == _ZSTD and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(payload).decode("utf-8")
+    return None
+
+
+class ResponseCache:
+    """
+    Memoizes LLM response contents keyed by a hash of the request.
+
+    The key covers everything that affects the response (model, messages,
+    response schema, sampling parameters), so identical requests share an
+    entry. Entries are held in memory and, if a path is given, persisted
+    to SQLite so repeated benchmark runs can reuse them.
+
+    Writes to SQLite are buffered and committed in batches (see flush),
+    over one WAL-mode connection per thread; close (or use the cache as a
+    context manager) to flush and close them. The in-memory layer keeps
+    the max_memory_entries most recently used entries; older ones are
+    read back from SQLite (or lost, for a cache without a path). Larger values are stored
+    compressed (zstd if installed, else zlib) unless compress is False;
+    plain-text rows from older caches are read as before.
+
+    By default only deterministic requests (temperature == 0) are cached,
+    since sampled responses are supposed to differ between calls.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        deterministic_only: bool = True,
+        flush_every: int = 64,
+        compress: bool = True,
+        max_memory_entries: int = 10000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (in-memory only if not provided)
+            deterministic_only: Only cache requests with temperature == 0
+            flush_every: Buffered writes that trigger a flush to SQLite
+            compress: Compress values stored in SQLite
+            max_memory_entries: Entries kept in memory (least recently
+                used are evicted first)
+        """
+        self.path = Path(path) if path is not None else None
+        self.deterministic_only = deterministic_only
+        self.flush_every = flush_every
+        self.compress = compress
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._pending: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Every thread's connection, so close can reach them all
+        self._conns: list[sqlite3.Connection] = []
+        self.hits = 0
+        self.misses = 0
+
+        # Requests currently being fetched, so identical concurrent
+        # requests can await one result instead of each calling the API
+        self.inflight: dict[str, asyncio.Future] = {}
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn().execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection to the backing database."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; transactions are opened explicitly in set_many.
+            # Each connection is only used by its own thread, but close may
+            # be called from another.
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def _remember(self, key: str, value: str) -> None:
+        """Store an entry in memory, evicting the least recently used."""
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    @staticmethod
+    def make_key(request: dict) -> str:
+        """
+        Compute the cache key for a request.
+
+        The response schema is folded in by its digest, which is computed
+        once per schema object, so the (board-sized) schema isn't
+        re-encoded for every request that shares it. Schemas must not be
+        mutated after they are first used in a request.
+
+        Args:
+            request: Keyword arguments for client.chat.completions.create
+
+        Returns:
+            SHA-256 hex digest of the canonical JSON encoding of the request
+        """
+        response_format = request.get("response_format")
+        if response_format is not None and "json_schema" in response_format:
+            request = {
+                **request,
+                "response_format": {
+                    **response_format,
+                    "json_schema": _schema_digest(response_format["json_schema"]),
+                },
+            }
+        return _hash(_canonical(request)).hexdigest()
+
+    def is_cacheable(self, request: dict) -> bool:
+        """Check whether a request's response may be cached."""
+        if not self.deterministic_only:
+            return True
+        return request.get("temperature", 1.0) == 0
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The cached response content, or None on a miss
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+
+        if value is None and self.path is not None:
+            row = self._conn().execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                value = _decode(row[0])
+                if value is not None:
+                    self._remember(key, value)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response.
+
+        The entry is visible immediately; the SQLite write is buffered
+        until flush_every entries are pending or flush is called.
+
+        Args:
+            key: Cache key from make_key
+            value: Response content to store
+        """
+        if self._buffer(key, value):
+            self.flush()
+
+    def _buffer(self, key: str, value: str) -> bool:
+        """Record an entry in memory; return True if a flush is due."""
+        self._remember(key, value)
+        if self.path is None:
+            return False
+        with self._lock:
+            self._pending.append((key, value))
+            return len(self._pending) >= self.flush_every
+
+    def set_many(self, items: Iterable[tuple[str, str]]) -> None:
+        """
+        Write entries to SQLite in a single transaction.
+
+        Args:
+            items: (key, value) pairs
+        """
+        if self.compress:
+            items = [(key, _encode(value)) for key, value in items]
+
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                items,
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def flush(self) -> None:
+        """Commit buffered writes to SQLite."""
+        with self._lock:
+            items, self._pending = self._pending, []
+        if items:
+            self.set_many(items)
+
+    def close(self) -> None:
+        """Flush buffered writes and close every thread's connection."""
+        if self.path is None:
+            return
+        self.flush()
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        # Threads that use the cache again open a fresh connection
+        self._local = threading.local()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def aget(self, key: str) -> Optional[str]:
+        """Async version of get; SQLite lookups run in a worker thread."""
+        if self.path is None or key in self._memory:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """Async version of set; flushes to SQLite run in a worker thread."""
+        if self._buffer(key, value):
+            await asyncio.to_thread(self.flush)
+
+    async def aflush(self) -> None:
+        """Async version of flush."""
+        if self._pending:
+            await asyncio.to_thread(self.flush)
@@ -0,0 +1,222 @@
+"""Structured-output chat completion client with optional response caching."""
+
+import asyncio
+import random
+from typing import Optional
+
+import httpx
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, DefaultAsyncHttpxClient
+
+from .. import jsonio
+from .cache import ResponseCache
+
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+except ImportError:  # pragma: no cover - depends on installed extras
+    HAS_HTTP2 = False
+else:
+    HAS_HTTP2 = True
+
+# Status codes worth retrying (the same set the OpenAI SDK retries)
+RETRYABLE_STATUS = frozenset({408, 409, 429})
+
+
+def _retry_after(error: APIStatusError) -> Optional[float]:
+    """Get the server-requested delay in seconds from a response, if any."""
+    headers = error.response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        # HTTP-date form; fall back to jittered backoff
+        pass
+    return None
+
+
+def make_client(
+    max_connections: int = 64,
+    max_keepalive_connections: int = 32,
+    timeout: float = 120.0,
+    max_retries: int = 0,
+    http2: Optional[bool] = None,
+) -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client with a pool sized for concurrent rollouts.
+
+    The SDK default pool is tuned for a handful of in-flight requests;
+    a turn can have K x G rollouts in flight, so the pool is widened and
+    kept-alive connections are reused across the whole benchmark.
+
+    With HTTP/2, concurrent requests are multiplexed over a few
+    connections instead of each needing its own TCP/TLS handshake.
+
+    SDK-level retries are off by default, since StructuredClient retries
+    with jittered backoff itself.
+
+    Args:
+        max_connections: Maximum simultaneous connections
+        max_keepalive_connections: Idle connections kept open for reuse
+        timeout: Request timeout in seconds
+        max_retries: Retries performed by the SDK itself
+        http2: Negotiate HTTP/2 (default: when the h2 package is installed)
+
+    Returns:
+        Configured AsyncOpenAI client
+    """
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+        timeout=timeout,
+        http2=HAS_HTTP2 if http2 is None else http2,
+    )
+    return AsyncOpenAI(http_client=http_client, max_retries=max_retries)
+
+
+class StructuredClient:
+    """
+    Thin wrapper around AsyncOpenAI for structured JSON completions.
+
+    Requests are plain keyword-argument dicts for
+    client.chat.completions.create, so they can be hashed for caching
+    or serialized for the Batch API unchanged.
+
+    Rate limits (429), server errors and connection failures are retried
+    with full-jitter exponential backoff, so concurrent rollouts that hit
+    a limit together don't retry in lockstep. A Retry-After header from
+    the server takes precedence over the backoff. Other errors are raised
+    immediately.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        cache: Optional[ResponseCache] = None,
+        max_retries: int = 5,
+        max_backoff: float = 30.0,
+    ):
+        """
+        Initialize the structured client.
+
+        Args:
+            client: OpenAI client
+            cache: Response cache (no caching if not provided)
+            max_retries: Retries for rate-limited or failed requests
+            max_backoff: Cap on the backoff window in seconds
+        """
+        self.client = client
+        self.cache = cache
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.retry_counts: dict[str, int] = {}
+
+    async def create_json(self, request: dict) -> str:
+        """
+        Run a chat completion and return the message content.
+
+        Args:
+            request: Keyword arguments for client.chat.completions.create
+
+        Returns:
+            JSON content of the first choice
+        """
+        return (await self.create_json_choices(request, n=1))[0]
+
+    async def create_json_choices(self, request: dict, n: int) -> list[str]:
+        """
+        Run a chat completion sampling n choices from a single prompt.
+
+        The prompt is encoded (and billed) once, however many choices are
+        requested. Concurrent identical deterministic requests are coalesced
+        into a single API call when a cache is configured.
+
+        Args:
+            request: Keyword arguments for client.chat.completions.create
+            n: Number of choices to sample
+
+        Returns:
+            JSON content of each choice
+        """
+        if n > 1:
+            request = {**request, "n": n}
+
+        key = None
+        if self.cache is not None and self.cache.is_cacheable(request):
+            key = self.cache.make_key(request)
+            cached = await self.cache.aget(key)
+            if cached is not None:
+                return [cached] if n == 1 else jsonio.loads(cached)
+
+        # Only deterministic requests may share a response
+        if key is None or request.get("temperature", 1.0) != 0:
+            return await self._fetch(request, key)
+        return await self._fetch_coalesced(request, key)
+
+    async def _fetch(self, request: dict, key: Optional[str]) -> list[str]:
+        """Call the API and cache the choice contents under key."""
+        response = await self._create_with_retry(request)
+        contents = [choice.message.content for choice in response.choices]
+
+        if key is not None:
+            n = len(contents)
+            await self.cache.aset(key, contents[0] if n == 1 else jsonio.dumps(contents).decode())
+        return contents
+
+    async def _fetch_coalesced(self, request: dict, key: str) -> list[str]:
+        """Fetch, sharing one API call among concurrent identical requests."""
+        inflight = self.cache.inflight
+        while (future := inflight.get(key)) is not None:
+            try:
+                # Shielded so a cancelled waiter doesn't cancel the shared call
+                return list(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # The caller making the request was cancelled; take over
+
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            contents = await self._fetch(request, key)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved in case no other request was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(contents)
+            return contents
+        finally:
+            inflight.pop(key, None)
+
+    async def _create_with_retry(self, request: dict):
+        """Call the completions API, retrying transient failures."""
+        backoff = 1.0
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self.client.chat.completions.create(**request)
+            except APIStatusError as e:
+                status = e.status_code
+                if status not in RETRYABLE_STATUS and status < 500:
+                    raise
+                if attempt == self.max_retries:
+                    raise
+                kind = "5xx" if status >= 500 else str(status)
+                delay = _retry_after(e)
+            except APIConnectionError:
+                if attempt == self.max_retries:
+                    raise
+                kind = "connection"
+                delay = None
+
+            self.retry_counts[kind] = self.retry_counts.get(kind, 0) + 1
+            if delay is None:
+                delay = random.uniform(0, backoff)
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
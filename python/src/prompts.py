@@ -0,0 +1,48 @@
+"""Loading and rendering of prompt templates."""
+
+from pathlib import Path
+from typing import Callable
+
+# Template renderers keyed by path, with the file mtime they were read at
+_PROMPT_CACHE: dict[Path, tuple[int, Callable[..., str]]] = {}
+
+
+def load_prompt(prompt_file: Path) -> Callable[..., str]:
+    """
+    Load a prompt template and return its renderer.
+
+    Templates use str.format placeholders; the renderer is the template's
+    bound format method, called with keyword arguments. Renderers are
+    memoized per process (a benchmark builds fresh agents for every game)
+    and re-read only when the file's mtime changes.
+
+    Args:
+        prompt_file: Path to the template file
+
+    Returns:
+        Function rendering the template from keyword arguments
+    """
+    if not prompt_file.exists():
+        raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
+
+    mtime = prompt_file.stat().st_mtime_ns
+    cached = _PROMPT_CACHE.get(prompt_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    render = prompt_file.read_text().format
+    _PROMPT_CACHE[prompt_file] = (mtime, render)
+    return render
+
+
+def bullet_list(words: list[str]) -> str:
+    """
+    Render words as a markdown bullet list, one per line.
+
+    Args:
+        words: Words to list
+
+    Returns:
+        The list, or an empty string if there are no words
+    """
+    return "- " + "\n- ".join(words) if words else ""
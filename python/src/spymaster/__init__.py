@@ -1,5 +1,5 @@
 # Spymaster module
-from .spymaster import Spymaster, SpymasterConfig, SpymasterOutput, CandidateClue
+from .spymaster import Spymaster, SpymasterConfig, SpymasterOutput, CandidateClue, is_legal_clue_word
 from .schema_builder import build_spymaster_schema, build_simple_spymaster_schema
 
 __all__ = [
@@ -7,6 +7,7 @@ __all__ = [
     "SpymasterConfig",
     "SpymasterOutput",
     "CandidateClue",
+    "is_legal_clue_word",
     "build_spymaster_schema",
     "build_simple_spymaster_schema",
 ]
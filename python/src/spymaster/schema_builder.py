@@ -1,19 +1,29 @@
 """JSON Schema builder for spymaster structured outputs."""
 
+from functools import lru_cache
 from typing import Any
 
+# Sub-schemas that don't depend on the board, shared by every schema built
+_REASONING = {
+    "type": "string",
+    "description": "Why this clue connects the target words"
+}
+_CLUE = {
+    "type": "string",
+    "description": "A single word clue (no spaces, no board words)"
+}
+_RISK_ASSESSMENT = {
+    "type": "string",
+    "description": "Potential confusion with opponent/neutral/assassin words"
+}
+_NUMBER = {
+    "type": "integer",
+    "description": "Number of words this clue relates to (1-9)"
+}
 
-def build_spymaster_schema(team_words: list[str], num_candidates: int) -> dict[str, Any]:
-    """
-    Build a JSON Schema for spymaster output with dynamic enum of team words.
-
-    Args:
-        team_words: List of unrevealed words belonging to the spymaster's team
-        num_candidates: Number of candidate clues to generate
 
-    Returns:
-        JSON Schema dict suitable for OpenAI's response_format
-    """
+def _wrap(num_candidates: int, properties: dict[str, Any]) -> dict[str, Any]:
+    """Build the full response_format schema around per-candidate properties."""
     return {
         "name": "spymaster_output",
         "strict": True,
@@ -29,32 +39,7 @@ def build_spymaster_schema(team_words: list[str], num_candidates: int) -> dict[s
                         "type": "object",
                         "required": ["reasoning", "clue", "risk_assessment", "intended_targets", "number"],
                         "additionalProperties": False,
-                        "properties": {
-                            "reasoning": {
-                                "type": "string",
-                                "description": "Why this clue connects the target words"
-                            },
-                            "clue": {
-                                "type": "string",
-                                "description": "A single word clue (no spaces, no board words)"
-                            },
-                            "risk_assessment": {
-                                "type": "string",
-                                "description": "Potential confusion with opponent/neutral/assassin words"
-                            },
-                            "intended_targets": {
-                                "type": "array",
-                                "items": {
-                                    "type": "string",
-                                    "enum": team_words
-                                },
-                                "description": "The specific team words this clue hints at"
-                            },
-                            "number": {
-                                "type": "integer",
-                                "description": "Number of words this clue relates to (1-9)"
-                            }
-                        }
+                        "properties": properties,
                     }
                 }
             }
@@ -62,11 +47,48 @@ def build_spymaster_schema(team_words: list[str], num_candidates: int) -> dict[s
     }
 
 
+@lru_cache(maxsize=256)
+def _cached_spymaster_schema(team_words: tuple[str, ...], num_candidates: int) -> dict[str, Any]:
+    return _wrap(num_candidates, {
+        "reasoning": _REASONING,
+        "clue": _CLUE,
+        "risk_assessment": _RISK_ASSESSMENT,
+        "intended_targets": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": list(team_words)
+            },
+            "description": "The specific team words this clue hints at"
+        },
+        "number": _NUMBER,
+    })
+
+
+def build_spymaster_schema(team_words: list[str], num_candidates: int) -> dict[str, Any]:
+    """
+    Build a JSON Schema for spymaster output with dynamic enum of team words.
+
+    Schemas are memoized per (team_words, num_candidates) and shared between
+    callers, so treat the result as read-only.
+
+    Args:
+        team_words: List of unrevealed words belonging to the spymaster's team
+        num_candidates: Number of candidate clues to generate
+
+    Returns:
+        JSON Schema dict suitable for OpenAI's response_format
+    """
+    return _cached_spymaster_schema(tuple(team_words), num_candidates)
+
+
+@lru_cache(maxsize=32)
 def build_simple_spymaster_schema(num_candidates: int) -> dict[str, Any]:
     """
     Build a simpler schema without enum constraint on targets.
 
-    Use this when you want more flexibility in the output.
+    Use this when you want more flexibility in the output. Schemas are
+    memoized per num_candidates, so treat the result as read-only.
 
     Args:
         num_candidates: Number of candidate clues to generate
@@ -74,46 +96,23 @@ def build_simple_spymaster_schema(num_candidates: int) -> dict[str, Any]:
     Returns:
         JSON Schema dict suitable for OpenAI's response_format
     """
-    return {
-        "name": "spymaster_output",
-        "strict": True,
-        "schema": {
-            "type": "object",
-            "required": ["candidates"],
-            "additionalProperties": False,
-            "properties": {
-                "candidates": {
-                    "type": "array",
-                    "description": f"Generate exactly {num_candidates} diverse candidate clues",
-                    "items": {
-                        "type": "object",
-                        "required": ["reasoning", "clue", "risk_assessment", "intended_targets", "number"],
-                        "additionalProperties": False,
-                        "properties": {
-                            "reasoning": {
-                                "type": "string",
-                                "description": "Why this clue connects the target words"
-                            },
-                            "clue": {
-                                "type": "string",
-                                "description": "A single word clue"
-                            },
-                            "risk_assessment": {
-                                "type": "string",
-                                "description": "Potential risks with this clue"
-                            },
-                            "intended_targets": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "The board words this clue hints at"
-                            },
-                            "number": {
-                                "type": "integer",
-                                "description": "Number of words this clue relates to"
-                            }
-                        }
-                    }
-                }
-            }
+    return _wrap(num_candidates, {
+        "reasoning": _REASONING,
+        "clue": {
+            "type": "string",
+            "description": "A single word clue"
+        },
+        "risk_assessment": {
+            "type": "string",
+            "description": "Potential risks with this clue"
+        },
+        "intended_targets": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "The board words this clue hints at"
+        },
+        "number": {
+            "type": "integer",
+            "description": "Number of words this clue relates to"
         }
-    }
+    })
@@ -1,18 +1,84 @@
 """Spymaster LLM interface for generating candidate clues."""
 
-import json
+import asyncio
+import logging
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from openai import AsyncOpenAI
 
+from .. import jsonio
 from ..game import GameState, Team, CardType, Clue
+from ..llm import ResponseCache, StructuredClient, make_client
 from ..paths import PROMPTS_DIR
-from .schema_builder import build_spymaster_schema
+from ..prompts import bullet_list, load_prompt
+from .schema_builder import build_simple_spymaster_schema, build_spymaster_schema
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Clues must be a single token
+_WHITESPACE = re.compile(r"\s")
+
+# Card type labels for the revealed-words list (avoids Enum.value lookups)
+_CARD_LABELS = {t: t.value for t in CardType}
+
+
+@lru_cache(maxsize=128)
+def _board_substring_matchers(words: tuple[str, ...]) -> tuple[re.Pattern, str]:
+    """Build (board-word alternation, joined board text) for substring checks."""
+    upper = sorted({w.upper() for w in words}, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(w) for w in upper))
+    return pattern, "\n".join(upper)
+
+
+def is_legal_clue_word(
+    word: str,
+    state: GameState,
+    forbid_substrings: bool = False,
+) -> bool:
+    """
+    Check that a clue word is a single word and not on the board.
+
+    Args:
+        word: The clue word
+        state: Current game state
+        forbid_substrings: Also reject clues that contain a board word or
+            are contained in one (e.g. SNOW for SNOWMAN)
+
+    Returns:
+        True if the clue word may be given
+    """
+    if _WHITESPACE.search(word) is not None or state.get_word_index(word) is not None:
+        return False
+
+    if forbid_substrings:
+        # One pass over the clue for every board word, one pass over the board
+        pattern, board_text = _board_substring_matchers(tuple(state.words))
+        word_upper = word.upper()
+        if pattern.search(word_upper) or word_upper in board_text:
+            return False
+
+    return True
+
+
+def _split_call_request(request: dict, index: int, total: int) -> dict:
+    """Number one of several concurrent candidate requests in its prompt."""
+    *history, last = request["messages"]
+    note = (
+        f"\n\nThis is candidate set {index + 1} of {total}. The other sets are "
+        "generated separately, so vary your approach to avoid repeating their clues."
+    )
+    return {
+        **request,
+        "messages": [*history, {**last, "content": last["content"] + note}],
+    }
+
+
+@dataclass(slots=True)
 class CandidateClue:
     """A candidate clue generated by the spymaster."""
     clue: str
@@ -31,10 +97,11 @@ class CandidateClue:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SpymasterOutput:
     """Complete output from the spymaster."""
     candidates: list[CandidateClue]
+    failed_calls: int = 0  # Split calls that failed (their candidates are missing)
 
 
 @dataclass
@@ -44,6 +111,8 @@ class SpymasterConfig:
     prompt_id: str = "spymaster_v1"
     temperature: float = 0.7
     candidates_per_turn: int = 8
+    candidates_per_call: Optional[int] = None  # None means one call for all candidates
+    enum_schema: bool = True  # Constrain targets to team words via a schema enum
 
 
 class Spymaster:
@@ -59,6 +128,11 @@ class Spymaster:
 
     These candidates are then evaluated by simulating guesser behavior
     to select the best clue.
+
+    With enum_schema disabled, a schema that only depends on the number of
+    candidates is sent instead, so it stays the same across turns and the
+    API's compiled-schema cache is reused; intended targets are then
+    checked against the team's words locally.
     """
 
     def __init__(
@@ -66,61 +140,64 @@ class Spymaster:
         config: SpymasterConfig,
         client: Optional[AsyncOpenAI] = None,
         prompts_dir: Optional[Path] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize the spymaster.
 
         Args:
             config: Spymaster configuration
-            client: OpenAI client (creates one if not provided)
+            client: OpenAI client (make_client() if not provided)
             prompts_dir: Directory containing prompt templates
+            cache: Response cache for deterministic requests
         """
         self.config = config
-        self.client = client or AsyncOpenAI()
+        self.client = client or make_client()
+        self.llm = StructuredClient(self.client, cache)
 
         if prompts_dir is None:
             prompts_dir = PROMPTS_DIR
         self.prompts_dir = prompts_dir
 
-        self._prompt_template = self._load_prompt()
+        self._render_prompt = self._load_prompt()
 
-    def _load_prompt(self) -> str:
-        """Load the prompt template."""
-        prompt_file = self.prompts_dir / f"{self.config.prompt_id}.txt"
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
-        return prompt_file.read_text()
+    def _load_prompt(self) -> Callable[..., str]:
+        """Load the prompt template's renderer."""
+        return load_prompt(self.prompts_dir / f"{self.config.prompt_id}.txt")
 
-    def _format_prompt(self, state: GameState, team: Team) -> str:
+    def _format_prompt(
+        self,
+        state: GameState,
+        team: Team,
+        num_candidates: Optional[int] = None,
+    ) -> str:
         """Format the prompt with game state information."""
-        # Get words by type
+        words, key, revealed = state.words, state.key, state.revealed
+
+        # Partition by position using the state's cached per-type indices
         team_words = state.get_remaining_words(team)
         opponent_words = state.get_remaining_words(team.opponent)
 
         neutral_words = [
-            w for w, t, r in zip(state.words, state.key, state.revealed)
-            if t == CardType.NEUTRAL and not r
+            words[i] for i in state.get_type_indices(CardType.NEUTRAL)
+            if not revealed[i]
         ]
 
-        assassin_word = next(
-            w for w, t in zip(state.words, state.key)
-            if t == CardType.ASSASSIN
-        )
+        assassin_word = words[state.get_type_indices(CardType.ASSASSIN)[0]]
 
         revealed_words = [
-            f"{w} ({state.key[i].value})"
-            for i, (w, r) in enumerate(zip(state.words, state.revealed))
-            if r
+            f"{words[i]} ({_CARD_LABELS[key[i]]})"
+            for i, r in enumerate(revealed) if r
         ]
 
-        return self._prompt_template.format(
+        return self._render_prompt(
             team=team.value.upper(),
-            team_words="\n".join(f"- {w}" for w in team_words),
-            opponent_words="\n".join(f"- {w}" for w in opponent_words),
-            neutral_words="\n".join(f"- {w}" for w in neutral_words),
+            team_words=bullet_list(team_words),
+            opponent_words=bullet_list(opponent_words),
+            neutral_words=bullet_list(neutral_words),
             assassin_word=assassin_word,
-            revealed_words="\n".join(f"- {w}" for w in revealed_words) or "(none)",
-            num_candidates=self.config.candidates_per_turn,
+            revealed_words=bullet_list(revealed_words) or "(none)",
+            num_candidates=num_candidates or self.config.candidates_per_turn,
         )
 
     async def generate_candidates(
@@ -143,40 +220,143 @@ class Spymaster:
             SpymasterOutput with list of candidate clues
         """
         num_candidates = num_candidates or self.config.candidates_per_turn
-        team_words = state.get_remaining_words(team)
+        per_call = self.config.candidates_per_call
+        targets = self._target_lookup(state, team)
 
-        prompt = self._format_prompt(state, team)
-        schema = build_spymaster_schema(team_words, num_candidates)
+        if not per_call or per_call >= num_candidates:
+            candidates = await self._request_candidates(
+                self._build_request(state, team, num_candidates, temperature), targets
+            )
+            return SpymasterOutput(candidates=candidates)
+
+        # Split the K candidates across concurrent calls. Output tokens are
+        # generated serially within a call, so smaller calls finish sooner.
+        sizes = [per_call] * (num_candidates // per_call)
+        if num_candidates % per_call:
+            sizes.append(num_candidates % per_call)
+
+        # At most two distinct sizes, so build each prompt/schema only once
+        by_size = {
+            size: self._build_request(state, team, size, temperature)
+            for size in set(sizes)
+        }
+        # Identical requests would be coalesced (or served from the cache)
+        # into one call, returning the same candidates, so each is numbered
+        requests = [
+            _split_call_request(by_size[size], index, len(sizes))
+            for index, size in enumerate(sizes)
+        ]
+
+        results = await asyncio.gather(
+            *(self._request_candidates(request, targets) for request in requests),
+            return_exceptions=True,
+        )
+
+        # Cancellation (and other non-Exception exits) isn't a failed call
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+        errors = [r for r in results if isinstance(r, Exception)]
+        # Calls can't see each other's clues, so drop repeats across them
+        seen: set[str] = set()
+        candidates = []
+        for result in results:
+            if isinstance(result, Exception):
+                continue
+            for c in result:
+                if c.clue.upper() not in seen:
+                    seen.add(c.clue.upper())
+                    candidates.append(c)
+        if errors and not candidates:
+            # Every call failed - surface the first error
+            raise errors[0]
+
+        if errors:
+            logger.warning(
+                "%d of %d spymaster calls failed; continuing with %d candidates: %s",
+                len(errors), len(sizes), len(candidates),
+                "; ".join(repr(e) for e in errors),
+            )
+
+        return SpymasterOutput(candidates=candidates, failed_calls=len(errors))
 
-        response = await self.client.chat.completions.create(
-            model=self.config.model,
-            messages=[
+    def _build_request(
+        self,
+        state: GameState,
+        team: Team,
+        num_candidates: int,
+        temperature: Optional[float] = None,
+    ) -> dict:
+        """Build the chat completion request for num_candidates clues."""
+        prompt = self._format_prompt(state, team, num_candidates)
+        if self.config.enum_schema:
+            schema = build_spymaster_schema(state.get_remaining_words(team), num_candidates)
+        else:
+            schema = build_simple_spymaster_schema(num_candidates)
+
+        return {
+            "model": self.config.model,
+            "messages": [
                 {"role": "user", "content": prompt}
             ],
-            temperature=temperature or self.config.temperature,
-            response_format={
+            "temperature": temperature or self.config.temperature,
+            "response_format": {
                 "type": "json_schema",
                 "json_schema": schema,
             },
-        )
+        }
+
+    def _target_lookup(self, state: GameState, team: Team) -> Optional[dict[str, str]]:
+        """
+        Map uppercased team words to their board spelling.
+
+        Only needed when the schema doesn't constrain targets (enum_schema
+        disabled); returns None otherwise.
+        """
+        if self.config.enum_schema:
+            return None
+        return {w.upper(): w for w in state.get_remaining_words(team)}
+
+    async def _request_candidates(
+        self,
+        request: dict,
+        targets: Optional[dict[str, str]] = None,
+    ) -> list[CandidateClue]:
+        """
+        Make a single spymaster call and parse the candidate clues.
+
+        Args:
+            request: Request from _build_request
+            targets: Team words keyed by uppercased word (see _target_lookup);
+                when given, intended targets outside it are dropped and the
+                rest are returned in board spelling
+
+        Returns:
+            Parsed candidate clues
+        """
+        content = await self.llm.create_json(request)
 
         # Parse the structured response
-        content = response.choices[0].message.content
-        data = json.loads(content)
+        data = jsonio.loads_object(content)
 
-        candidates = [
+        return [
             CandidateClue(
                 clue=c["clue"],
                 number=c["number"],
-                intended_targets=c["intended_targets"],
+                intended_targets=(
+                    c["intended_targets"] if targets is None
+                    else [
+                        targets[t] for t in map(str.upper, c["intended_targets"])
+                        if t in targets
+                    ]
+                ),
                 reasoning=c["reasoning"],
                 risk_assessment=c["risk_assessment"],
             )
             for c in data["candidates"]
         ]
 
-        return SpymasterOutput(candidates=candidates)
-
     async def generate_single_clue(
         self,
         state: GameState,
@@ -213,24 +393,21 @@ class Spymaster:
         errors = []
 
         # Check clue is a single word
-        if " " in clue.clue:
+        if _WHITESPACE.search(clue.clue):
             errors.append(f"Clue '{clue.clue}' contains spaces")
 
         # Check clue is not on the board
-        clue_upper = clue.clue.upper()
-        for word in state.words:
-            if word.upper() == clue_upper:
-                errors.append(f"Clue '{clue.clue}' is on the board")
-                break
+        if state.get_word_index(clue.clue) is not None:
+            errors.append(f"Clue '{clue.clue}' is on the board")
 
         # Check number is reasonable
         if clue.number < 1 or clue.number > 9:
             errors.append(f"Number {clue.number} is out of range (1-9)")
 
         # Check intended targets are valid
-        unrevealed = set(w.upper() for w in state.get_unrevealed_words())
         for target in clue.intended_targets:
-            if target.upper() not in unrevealed:
+            index = state.get_word_index(target)
+            if index is None or state.revealed[index]:
                 errors.append(f"Target '{target}' is not an unrevealed word")
 
         return errors
@@ -0,0 +1,20 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+from src.game import GameState, Team, BoardGenerator
+
+
+@pytest.fixture(scope="session")
+def board_generator() -> BoardGenerator:
+    return BoardGenerator()
+
+
+@pytest.fixture(scope="session")
+def _base_state(board_generator: BoardGenerator) -> GameState:
+    # Generated once per session; tests get their own copy via game_state
+    return board_generator.generate_board(starting_team=Team.RED, seed=42)
+
+
+@pytest.fixture
+def game_state(_base_state: GameState) -> GameState:
+    return _base_state.copy()
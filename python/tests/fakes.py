@@ -0,0 +1,67 @@
+"""Deterministic stand-ins for the OpenAI client used by the tests."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+
+def _response(contents: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=c)) for c in contents],
+        usage=None,
+    )
+
+
+class FakeCompletions:
+    """Answers spymaster and guesser requests from their response schemas."""
+
+    def __init__(self, owner: "FakeClient"):
+        self.owner = owner
+
+    async def create(self, **request):
+        self.owner.calls.append(request)
+        if self.owner.latency:
+            await asyncio.sleep(self.owner.latency)
+        if self.owner.errors:
+            error = self.owner.errors.pop(0)
+            if error is not None:
+                raise error
+        schema = request["response_format"]["json_schema"]
+        n = request.get("n", 1)
+
+        if schema["name"] == "spymaster_output":
+            description = schema["schema"]["properties"]["candidates"]["description"]
+            k = int(description.split("exactly ")[1].split()[0])
+            candidates = []
+            for _ in range(k):
+                self.owner.clue_counter += 1
+                candidates.append({
+                    "clue": f"CLUE{self.owner.clue_counter}",
+                    "number": 2,
+                    "intended_targets": [],
+                    "reasoning": "",
+                    "risk_assessment": "",
+                })
+            return _response([json.dumps({"candidates": candidates})])
+
+        # Guesser: the first unrevealed words, in board order
+        word = schema["schema"]["properties"]["guesses"]["items"]["properties"]["word"]
+        guesses = [
+            {"word": w, "confidence": 1.0 - i / 10}
+            for i, w in enumerate(word["enum"][:3])
+        ]
+        content = json.dumps({"reasoning": "", "guesses": guesses, "stop_after": 0})
+        return _response([content] * n)
+
+
+class FakeClient:
+    """Minimal AsyncOpenAI stand-in recording every chat completion request."""
+
+    def __init__(self, errors: list = (), latency: float = 0.0):
+        self.calls: list[dict] = []
+        # Raised by successive calls, front first (None lets a call succeed)
+        self.errors = list(errors)
+        # Seconds each call takes, so concurrent calls overlap
+        self.latency = latency
+        self.clue_counter = 0
+        self.chat = SimpleNamespace(completions=FakeCompletions(self))
@@ -0,0 +1,121 @@
+"""Tests for the benchmark runner and metrics."""
+
+import asyncio
+import time
+
+import pytest
+from click.testing import CliRunner
+from src import jsonio
+from src.benchmark import BenchmarkRunner, GameLogWriter, RunnerConfig
+from src.benchmark import gamelog as gamelog_module
+from src.cli import main
+from src.evaluation import AgentConfig
+from src.paths import SHARED_DIR
+
+from .fakes import FakeClient
+
+BASELINE = SHARED_DIR / "configs" / "baseline.json"
+
+
+async def _play(board, keep_turns: bool):
+    config = AgentConfig.load_from_file(str(BASELINE))
+    runner = BenchmarkRunner(
+        config,
+        client=FakeClient(),
+        runner_config=RunnerConfig(verbose=False, keep_turns=keep_turns),
+    )
+    return await runner.run_benchmark([board], mirror=False)
+
+
+class TestDropTurns:
+    async def test_dropping_turns_keeps_metrics(self, game_state):
+        kept = await _play(game_state.copy(), keep_turns=True)
+        dropped = await _play(game_state.copy(), keep_turns=False)
+
+        kept_game, dropped_game = kept.games[0], dropped.games[0]
+        assert kept_game.turns
+        assert dropped_game.turns == []
+        assert kept_game.correct_per_clue > 0
+        assert dropped_game.correct_per_clue == kept_game.correct_per_clue
+
+        kept_dict, dropped_dict = kept_game.to_dict(), dropped_game.to_dict()
+        kept_dict.pop("turns"), dropped_dict.pop("turns")
+        kept_dict.pop("game_duration_s"), dropped_dict.pop("game_duration_s")
+        assert dropped_dict == kept_dict
+
+        assert dropped.avg_correct_per_clue == kept.avg_correct_per_clue
+        assert dropped.opponent_flip_rate == kept.opponent_flip_rate
+
+
+class TestBenchmarkCommand:
+    def test_drop_turns_requires_games_log(self, tmp_path):
+        boards = tmp_path / "boards.jsonl"
+        boards.write_text("")
+        result = CliRunner().invoke(
+            main, ["benchmark", "-c", str(BASELINE), "-b", str(boards), "--drop-turns"]
+        )
+        assert result.exit_code == 2
+        assert "--drop-turns requires --games-log" in result.output
+
+
+def _records(path) -> list:
+    return [jsonio.loads(line) for line in path.read_bytes().splitlines()]
+
+
+class TestGameLogWriter:
+    async def test_appends_one_line_per_record(self, tmp_path):
+        path = tmp_path / "logs" / "games.jsonl"
+        async with GameLogWriter(path) as log:
+            for i in range(3):
+                await log.write({"game": i})
+        async with GameLogWriter(path) as log:
+            await log.write({"game": 3})
+
+        assert _records(path) == [{"game": i} for i in range(4)]
+
+    async def test_games_reach_file_before_close(self, tmp_path):
+        path = tmp_path / "games.jsonl"
+        async with GameLogWriter(path) as log:
+            await log.write({"game": 0})
+            # Written by the background task without waiting for close
+            for _ in range(200):
+                if path.exists() and path.read_bytes():
+                    break
+                await asyncio.sleep(0.01)
+            assert _records(path) == [{"game": 0}]
+
+
+@pytest.fixture
+def failing_disk(monkeypatch):
+    """Make every write by the games log writer fail, after a moment."""
+    def write_flushed(f, data):
+        # Slow enough for the queue to fill while the writer is still alive
+        time.sleep(0.05)
+        raise OSError("disk full")
+    monkeypatch.setattr(gamelog_module, "_write_flushed", write_flushed)
+
+
+class TestGameLogWriterErrors:
+    async def test_write_fails_when_writer_dies_with_full_queue(self, tmp_path, failing_disk):
+        error = None
+        with pytest.raises(OSError, match="disk full"):
+            async with GameLogWriter(tmp_path / "games.jsonl", max_pending=1) as log:
+                # Without racing the writer task, a put on the full queue hangs
+                try:
+                    for i in range(10):
+                        await asyncio.wait_for(log.write({"game": i}), timeout=5)
+                except OSError as e:
+                    error = e
+        # Not a wait_for timeout (TimeoutError is an OSError too)
+        assert "disk full" in str(error)
+
+    async def test_writer_error_raised_on_close(self, tmp_path, failing_disk):
+        with pytest.raises(OSError, match="disk full"):
+            async with GameLogWriter(tmp_path / "games.jsonl") as log:
+                await log.write({"game": 0})
+
+    async def test_body_error_not_masked(self, tmp_path, failing_disk):
+        with pytest.raises(ValueError, match="body"):
+            async with GameLogWriter(tmp_path / "games.jsonl") as log:
+                await log.write({"game": 0})
+                raise ValueError("body")
@@ -0,0 +1,250 @@
+"""Tests for rollout evaluation."""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+from src import jsonio
+from src.game import Clue, Team
+from src.guesser import Guesser, GuesserConfig
+from src.evaluation import (
+    AgentConfig, AggregationMethod, BatchSimulator, SimulatorConfig, get_aggregator,
+    evaluate_candidates_ucb,
+)
+from src.paths import SHARED_DIR
+from src.evaluation import simulator as simulator_module
+from src.evaluation.batch import submit_batch
+
+from .fakes import FakeClient
+
+
+def _batch_simulator(client: FakeClient, **config) -> BatchSimulator:
+    guesser = Guesser(GuesserConfig(), client=client)
+    return BatchSimulator(guesser, config=SimulatorConfig(**config))
+
+
+def _stub_submit_batch(fails):
+    """Batch submitter answering live, with None for custom_ids matching fails."""
+    async def submit_batch(client, requests, **kwargs):
+        bodies = []
+        for r in requests:
+            if fails(r["custom_id"]):
+                bodies.append(None)
+                continue
+            response = await client.chat.completions.create(**r["body"])
+            content = response.choices[0].message.content
+            bodies.append({"choices": [{"message": {"content": content}}]})
+        return bodies
+    return submit_batch
+
+
+@pytest.fixture
+def candidates():
+    return [Clue(word=w, number=2, team=Team.RED) for w in ("ALPHA", "BETA")]
+
+
+def _stub_rollouts(simulator, rewards: dict[str, float], step: float = 0.0):
+    """
+    Make simulate_prepared return fixed rewards per clue word.
+
+    Each candidate's k-th rollout finishes after k * step seconds; the
+    returned list records the clue word of every rollout that finished.
+    """
+    finished = []
+    started = {word: 0 for word in rewards}
+
+    async def simulate_prepared(prepared):
+        word = prepared.clue.word
+        k = started[word]
+        started[word] += 1
+        await asyncio.sleep(k * step)
+        finished.append(word)
+        return SimpleNamespace(
+            clue=prepared.clue, reward=SimpleNamespace(total_reward=rewards[word])
+        )
+
+    simulator.simulate_prepared = simulate_prepared
+    return finished
+
+
+class TestBatchApiEvaluation:
+    async def test_failed_candidates_fall_back_to_live_calls(
+        self, monkeypatch, caplog, game_state, candidates
+    ):
+        client = FakeClient()
+        batch_sim = _batch_simulator(client, use_batch_api=True)
+        # Every entry for the first candidate fails
+        monkeypatch.setattr(
+            simulator_module, "submit_batch", _stub_submit_batch(lambda i: i.startswith("0:"))
+        )
+        with caplog.at_level(logging.WARNING, logger=simulator_module.__name__):
+            result = await batch_sim.evaluate_candidates(game_state, candidates, 3)
+
+        assert len(result.candidate_results["ALPHA"]) == 3
+        assert len(result.candidate_results["BETA"]) == 3
+        # Three batch bodies for BETA, then one live n=3 call for ALPHA
+        assert len(client.calls) == 4
+        assert client.calls[-1]["n"] == 3
+        assert "3 of 6 batch rollouts failed" in caplog.text
+
+    async def test_partial_failures_keep_remaining_rollouts(
+        self, monkeypatch, game_state, candidates
+    ):
+        client = FakeClient()
+        batch_sim = _batch_simulator(client, use_batch_api=True)
+        # The first rollout of each candidate fails
+        monkeypatch.setattr(
+            simulator_module, "submit_batch", _stub_submit_batch(lambda i: i.endswith(":0"))
+        )
+        result = await batch_sim.evaluate_candidates(game_state, candidates, 3)
+
+        assert len(result.candidate_results["ALPHA"]) == 2
+        assert len(result.candidate_results["BETA"]) == 2
+        assert len(client.calls) == 4
+
+
+class TestRacing:
+    async def test_dominated_candidate_pruned(self, game_state, candidates):
+        batch_sim = _batch_simulator(
+            FakeClient(), race_rollouts=True, race_min_samples=2, share_rollout_prompt=False
+        )
+        finished = _stub_rollouts(
+            batch_sim.simulator, {"ALPHA": 5.0, "BETA": -5.0}, step=0.01
+        )
+        result = await batch_sim.evaluate_candidates(game_state, candidates, 6)
+
+        assert len(result.candidate_results["ALPHA"]) == 6
+        # BETA is cancelled once both have two rollouts; those it had are kept
+        assert 2 <= len(result.candidate_results["BETA"]) < 6
+        assert finished.count("BETA") == len(result.candidate_results["BETA"])
+
+    async def test_overlapping_candidates_run_to_completion(self, game_state, candidates):
+        batch_sim = _batch_simulator(FakeClient(), race_rollouts=True)
+        _stub_rollouts(batch_sim.simulator, {"ALPHA": 1.0, "BETA": 1.0}, step=0.001)
+        result = await batch_sim.evaluate_candidates(game_state, candidates, 4)
+
+        assert [len(r) for r in result.candidate_results.values()] == [4, 4]
+
+
+def _rollouts(rewards: list[float]) -> list:
+    # Aggregators only read the clue word and total reward
+    clue = SimpleNamespace(word="CLUE")
+    return [
+        SimpleNamespace(clue=clue, reward=SimpleNamespace(total_reward=r))
+        for r in rewards
+    ]
+
+
+class TestAggregators:
+    def test_stats(self):
+        score = get_aggregator(AggregationMethod.MEAN).aggregate(_rollouts([1.0, 2.0, 6.0]))
+        assert score.mean == pytest.approx(3.0)
+        assert score.std == pytest.approx(((4 + 1 + 9) / 3) ** 0.5)
+        assert (score.min, score.max, score.n_rollouts) == (1.0, 6.0, 3)
+
+    @pytest.mark.parametrize("reward", [-19.2, -3.3, 0.1, 2.7, 19.9])
+    def test_identical_rewards_have_zero_std(self, reward):
+        score = get_aggregator(AggregationMethod.MEAN_MINUS_STD).aggregate(_rollouts([reward] * 3))
+        assert score.std == 0.0
+        assert score.mean == reward
+        assert score.score == reward
+
+    def test_empty_rollouts_rejected(self):
+        with pytest.raises(ValueError, match="empty"):
+            get_aggregator(AggregationMethod.MEAN).aggregate([])
+
+
+class TestUcbAllocation:
+    @pytest.fixture
+    def simulator(self):
+        return _batch_simulator(FakeClient()).simulator
+
+    async def test_budget_favours_better_candidate(self, simulator, game_state):
+        clues = [Clue(word=w, number=2, team=Team.RED) for w in ("ALPHA", "BETA", "GAMMA")]
+        _stub_rollouts(simulator, {"ALPHA": 1.0, "BETA": 9.0, "GAMMA": 0.0})
+        result = await evaluate_candidates_ucb(simulator, game_state, clues, budget=30)
+
+        counts = {word: len(r) for word, r in result.candidate_results.items()}
+        assert sum(counts.values()) == 30
+        assert min(counts.values()) >= 1
+        assert counts["BETA"] > counts["ALPHA"] and counts["BETA"] > counts["GAMMA"]
+
+    async def test_no_candidates(self, simulator, game_state):
+        result = await evaluate_candidates_ucb(simulator, game_state, [], budget=10)
+        assert result.candidate_results == {}
+
+    async def test_budget_below_candidate_count_rejected(self, simulator, game_state, candidates):
+        with pytest.raises(ValueError, match="budget"):
+            await evaluate_candidates_ucb(simulator, game_state, candidates, budget=1)
+
+    async def test_budget_equal_to_candidate_count(self, simulator, game_state, candidates):
+        result = await evaluate_candidates_ucb(simulator, game_state, candidates, budget=2)
+        assert [len(r) for r in result.candidate_results.values()] == [1, 1]
+
+    def test_config_rejects_budget_below_candidates(self):
+        data = jsonio.loads((SHARED_DIR / "configs" / "baseline.json").read_bytes())
+        data["selection"]["rollout_budget"] = data["spymaster"]["candidates_per_turn"] - 1
+        with pytest.raises(ValueError, match="rollout_budget"):
+            AgentConfig.from_dict(data)
+
+
+class _FakeBatchClient:
+    """Files and Batches API stand-in answering with a canned output file."""
+
+    def __init__(self, output_lines: list[str], statuses=("in_progress", "completed")):
+        self.uploaded = None
+        self.statuses = list(statuses)
+        self.output_lines = output_lines
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = SimpleNamespace(create=self._batch, retrieve=self._batch_by_id)
+
+    async def _upload(self, file, purpose):
+        self.uploaded = file[1]
+        return SimpleNamespace(id="file-in")
+
+    async def _batch(self, **kwargs):
+        return await self._batch_by_id("batch-1")
+
+    async def _batch_by_id(self, batch_id):
+        status = self.statuses.pop(0)
+        output = "file-out" if status == "completed" else None
+        return SimpleNamespace(id=batch_id, status=status, output_file_id=output)
+
+    async def _content(self, file_id):
+        return SimpleNamespace(text="\n".join(self.output_lines))
+
+
+def _output_line(custom_id: str, status_code: int, content: str = "") -> str:
+    return jsonio.dumps({
+        "custom_id": custom_id,
+        "response": {
+            "status_code": status_code,
+            "body": {"choices": [{"message": {"content": content}}]},
+        },
+    }).decode()
+
+
+class TestSubmitBatch:
+    async def test_bodies_follow_request_order(self):
+        requests = [{"custom_id": f"0:{i}", "body": {"n": i}} for i in range(4)]
+        client = _FakeBatchClient([
+            # Output order doesn't follow input order
+            _output_line("0:2", 200, "two"),
+            _output_line("0:0", 200, "zero"),
+            "",
+            _output_line("0:1", 500),
+            jsonio.dumps({"custom_id": "0:3", "response": None, "error": {}}).decode(),
+        ])
+        bodies = await submit_batch(client, requests, poll_interval=0)
+
+        contents = [b and b["choices"][0]["message"]["content"] for b in bodies]
+        assert contents == ["zero", None, "two", None]
+        uploaded = [jsonio.loads(line) for line in client.uploaded.splitlines()]
+        assert [u["custom_id"] for u in uploaded] == ["0:0", "0:1", "0:2", "0:3"]
+        assert uploaded[0]["body"] == {"n": 0}
+
+    async def test_failed_batch_raises(self):
+        client = _FakeBatchClient([], statuses=["failed"])
+        with pytest.raises(RuntimeError, match="failed"):
+            await submit_batch(client, [{"custom_id": "0:0", "body": {}}], poll_interval=0)
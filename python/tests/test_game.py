@@ -3,7 +3,7 @@
 import pytest
 from src.game import (
     GameState, Team, CardType, Card, Clue, Board,
-    GameRules, BoardGenerator
+    GameRules, BoardGenerator, BoardBatch
 )
 
 
@@ -20,16 +20,14 @@ class TestCardType:
 
 
 class TestBoardGenerator:
-    def test_generate_board_has_25_words(self):
-        gen = BoardGenerator()
-        state = gen.generate_board()
+    def test_generate_board_has_25_words(self, board_generator):
+        state = board_generator.generate_board()
         assert len(state.words) == 25
         assert len(state.key) == 25
         assert len(state.revealed) == 25
 
-    def test_generate_board_correct_distribution(self):
-        gen = BoardGenerator()
-        state = gen.generate_board(starting_team=Team.RED)
+    def test_generate_board_correct_distribution(self, board_generator):
+        state = board_generator.generate_board(starting_team=Team.RED)
 
         # Count card types
         red_count = sum(1 for ct in state.key if ct == CardType.RED)
@@ -43,9 +41,8 @@ class TestBoardGenerator:
         assert neutral_count == 7
         assert assassin_count == 1
 
-    def test_generate_board_blue_starts(self):
-        gen = BoardGenerator()
-        state = gen.generate_board(starting_team=Team.BLUE)
+    def test_generate_board_blue_starts(self, board_generator):
+        state = board_generator.generate_board(starting_team=Team.BLUE)
 
         red_count = sum(1 for ct in state.key if ct == CardType.RED)
         blue_count = sum(1 for ct in state.key if ct == CardType.BLUE)
@@ -54,32 +51,24 @@ class TestBoardGenerator:
         assert blue_count == 9
         assert red_count == 8
 
-    def test_generate_board_reproducible(self):
-        gen = BoardGenerator()
-        state1 = gen.generate_board(seed=42)
-        state2 = gen.generate_board(seed=42)
+    def test_generate_board_reproducible(self, board_generator):
+        state1 = board_generator.generate_board(seed=42)
+        state2 = board_generator.generate_board(seed=42)
         assert state1.words == state2.words
         assert state1.key == state2.key
 
-    def test_generate_board_different_seeds(self):
-        gen = BoardGenerator()
-        state1 = gen.generate_board(seed=42)
-        state2 = gen.generate_board(seed=43)
+    def test_generate_board_different_seeds(self, board_generator):
+        state1 = board_generator.generate_board(seed=42)
+        state2 = board_generator.generate_board(seed=43)
         # Very unlikely to be the same
         assert state1.words != state2.words
 
-    def test_all_words_unique(self):
-        gen = BoardGenerator()
-        state = gen.generate_board()
+    def test_all_words_unique(self, board_generator):
+        state = board_generator.generate_board()
         assert len(set(state.words)) == 25
 
 
 class TestGameState:
-    @pytest.fixture
-    def game_state(self):
-        gen = BoardGenerator()
-        return gen.generate_board(starting_team=Team.RED, seed=42)
-
     def test_get_unrevealed_words(self, game_state):
         assert len(game_state.get_unrevealed_words()) == 25
         game_state.revealed[0] = True
@@ -105,13 +94,32 @@ class TestGameState:
         copy.revealed[0] = True
         assert game_state.revealed[0] is False
 
+    def test_copy_shares_histories_until_written(self, game_state):
+        game_state.record_clue(Clue(word="ONE", number=1, team=Team.RED))
+        copy = game_state.copy()
+        assert copy.clue_history is game_state.clue_history
+
+        copy.record_clue(Clue(word="TWO", number=1, team=Team.RED))
+        copy.record_guess(copy.words[0], copy.key[0])
+        assert [c.word for c in game_state.clue_history] == ["ONE"]
+        assert game_state.guess_history == []
+        assert [c.word for c in copy.clue_history] == ["ONE", "TWO"]
+
+    def test_original_writes_leave_copies_alone(self, game_state):
+        first = game_state.copy()
+        second = first.copy()
+        game_state.record_guess(game_state.words[0], game_state.key[0])
+        first.record_guess(first.words[1], first.key[1])
+
+        assert [w for w, _ in game_state.guess_history] == [game_state.words[0]]
+        assert [w for w, _ in first.guess_history] == [first.words[1]]
+        assert second.guess_history == []
+
 
 class TestBoard:
     @pytest.fixture
-    def board(self):
-        gen = BoardGenerator()
-        state = gen.generate_board(starting_team=Team.RED, seed=42)
-        return Board.from_game_state(state)
+    def board(self, game_state):
+        return Board.from_game_state(game_state)
 
     def test_get_card(self, board):
         card = board.get_card(0, 0)
@@ -135,9 +143,12 @@ class TestBoard:
 
 class TestGameRules:
     @pytest.fixture
-    def game_state(self):
-        gen = BoardGenerator()
-        return gen.generate_board(starting_team=Team.RED, seed=42)
+    def words_by_type(self, game_state):
+        # Board words grouped by card type, in board order
+        words = {ct: [] for ct in CardType}
+        for word, ct in zip(game_state.words, game_state.key):
+            words[ct].append(word)
+        return words
 
     def test_give_clue(self, game_state):
         clue = Clue(word="FRUIT", number=2, team=Team.RED)
@@ -164,30 +175,22 @@ class TestGameRules:
         clue = Clue(word="TEST", number=2, team=Team.RED)
         state = GameRules.give_clue(game_state, clue)
 
-        # Find a red word to guess
-        red_word = None
-        for word, ct in zip(state.words, state.key):
-            if ct == CardType.RED:
-                red_word = word
-                break
+        # Guess the first red word
+        red_index = state.key.index(CardType.RED)
+        red_word = state.words[red_index]
 
         new_state, result = GameRules.make_guess(state, red_word)
 
         assert result.correct is True
         assert result.card_type == CardType.RED
         assert new_state.red_remaining == 8  # One less
-        assert new_state.revealed[state.words.index(red_word)] is True
+        assert new_state.revealed[red_index] is True
 
-    def test_make_guess_wrong_ends_turn(self, game_state):
+    def test_make_guess_wrong_ends_turn(self, game_state, words_by_type):
         clue = Clue(word="TEST", number=2, team=Team.RED)
         state = GameRules.give_clue(game_state, clue)
 
-        # Find a neutral word
-        neutral_word = None
-        for word, ct in zip(state.words, state.key):
-            if ct == CardType.NEUTRAL:
-                neutral_word = word
-                break
+        neutral_word = words_by_type[CardType.NEUTRAL][0]
 
         new_state, result = GameRules.make_guess(state, neutral_word)
 
@@ -195,16 +198,11 @@ class TestGameRules:
         assert result.turn_ended is True
         assert new_state.current_team == Team.BLUE
 
-    def test_assassin_ends_game(self, game_state):
+    def test_assassin_ends_game(self, game_state, words_by_type):
         clue = Clue(word="TEST", number=2, team=Team.RED)
         state = GameRules.give_clue(game_state, clue)
 
-        # Find the assassin
-        assassin_word = None
-        for word, ct in zip(state.words, state.key):
-            if ct == CardType.ASSASSIN:
-                assassin_word = word
-                break
+        assassin_word = words_by_type[CardType.ASSASSIN][0]
 
         new_state, result = GameRules.make_guess(state, assassin_word)
 
@@ -212,13 +210,13 @@ class TestGameRules:
         assert result.winner == Team.BLUE  # RED guessed assassin, BLUE wins
         assert new_state.game_over is True
 
-    def test_find_all_words_wins(self, game_state):
+    def test_find_all_words_wins(self, game_state, words_by_type):
         # This is a more complex test - we need to find all red words
         clue = Clue(word="TEST", number=9, team=Team.RED)
         state = GameRules.give_clue(game_state, clue)
 
-        # Find and guess all red words
-        red_words = [w for w, ct in zip(state.words, state.key) if ct == CardType.RED]
+        # Guess all red words
+        red_words = words_by_type[CardType.RED]
 
         for word in red_words[:-1]:
             state, result = GameRules.make_guess(state, word)
@@ -233,14 +231,66 @@ class TestGameRules:
         new_state = GameRules.pass_turn(game_state)
         assert new_state.current_team == Team.BLUE
 
-    def test_simulate_guesses(self, game_state):
+    def test_simulate_guesses(self, game_state, words_by_type):
         clue = Clue(word="TEST", number=3, team=Team.RED)
         state = GameRules.give_clue(game_state, clue)
 
-        # Find some red words
-        red_words = [w for w, ct in zip(state.words, state.key) if ct == CardType.RED][:3]
+        red_words = words_by_type[CardType.RED][:3]
 
         new_state, turn_result = GameRules.simulate_guesses(state, red_words)
 
         assert turn_result.team_words_found == 3
         assert len(turn_result.guesses) == 3
+
+
+class TestBoardBatch:
+    @pytest.fixture
+    def boards(self, board_generator):
+        return [
+            board_generator.generate_board(seed=seed, starting_team=team)
+            for seed, team in [(1, Team.RED), (2, Team.BLUE), (3, Team.RED)]
+        ]
+
+    @staticmethod
+    def _assert_same_board(actual, expected):
+        assert actual.words == expected.words
+        assert actual.key == expected.key
+        assert actual.current_team == expected.current_team
+        assert (actual.red_remaining, actual.blue_remaining) == (
+            expected.red_remaining, expected.blue_remaining
+        )
+        assert actual.revealed == [False] * 25
+
+    def test_round_trip(self, boards):
+        batch = BoardBatch.from_states(boards)
+
+        assert len(batch) == 3
+        for actual, expected in zip(batch, boards):
+            self._assert_same_board(actual, expected)
+        self._assert_same_board(batch[1:][0], boards[1])
+        assert batch.count_cards(CardType.BLUE).tolist() == [8, 9, 8]
+
+    def test_load_from_jsonl(self, boards, tmp_path):
+        path = tmp_path / "boards.jsonl"
+        BoardGenerator.save_boards(boards, path)
+
+        batch = BoardGenerator.load_board_batch(path)
+        assert len(batch) == 3
+        for actual, expected in zip(batch, boards):
+            self._assert_same_board(actual, expected)
+        assert len(BoardGenerator.load_board_batch(path, max_boards=2)) == 2
+
+    def test_empty_batch(self, tmp_path):
+        path = tmp_path / "boards.jsonl"
+        path.write_text("")
+
+        batch = BoardGenerator.load_board_batch(path)
+
+        assert len(batch) == 0
+        assert list(batch) == []
+        assert batch.keys.shape == (0, 25)
+        assert len(batch[0:10]) == 0
+        assert batch.count_cards(CardType.RED).tolist() == []
+
+    def test_empty_batch_from_states(self):
+        assert len(BoardBatch.from_states([])) == 0
@@ -0,0 +1,256 @@
+"""Tests for the LLM client helpers."""
+
+import asyncio
+import sqlite3
+
+import httpx
+import openai
+import pytest
+from src import jsonio
+from src.game import Clue, Team
+from src.guesser import Guesser, GuesserConfig
+from src.spymaster import Spymaster, SpymasterConfig
+from src.llm import ResponseCache, StructuredClient
+from src.llm import cache as cache_module
+
+from .fakes import FakeClient
+
+
+def _request(schema: dict, **params) -> dict:
+    return {
+        "model": "m",
+        "messages": [{"role": "user", "content": "hi"}],
+        "response_format": {"type": "json_schema", "json_schema": schema},
+        "temperature": 0,
+        **params,
+    }
+
+
+SCHEMA = {"name": "out", "schema": {"type": "object"}}
+
+
+class TestResponseCache:
+    def test_make_key_ignores_key_order(self):
+        a = ResponseCache.make_key({"model": "m", "temperature": 0, "messages": []})
+        b = ResponseCache.make_key({"messages": [], "temperature": 0, "model": "m"})
+        assert a == b
+
+    def test_make_key_is_stable_across_environments(self):
+        # Keys must not depend on installed extras, or persisted caches miss
+        key = ResponseCache.make_key({"model": "m", "temperature": 0})
+        assert key == "5ea0bd3062f3367622f9db5beb24c92616972474713a12dc2db70d63c9e08824"
+
+    def test_make_key_independent_of_json_backend(self, monkeypatch):
+        # orjson and the stdlib encode small floats differently
+        key = ResponseCache.make_key(_request(dict(SCHEMA), temperature=0.00001))
+        monkeypatch.setattr(jsonio, "orjson", None)
+        assert ResponseCache.make_key(_request(dict(SCHEMA), temperature=0.00001)) == key
+
+    def test_round_trip(self):
+        cache = ResponseCache()
+        key = ResponseCache.make_key(_request(SCHEMA))
+        assert cache.get(key) is None
+        cache.set(key, '{"ok": true}')
+        # An equal request built from fresh objects finds the entry
+        assert cache.get(ResponseCache.make_key(_request(dict(SCHEMA)))) == '{"ok": true}'
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.parametrize("other", [
+        _request({"name": "out", "schema": {"type": "array"}}),
+        _request(SCHEMA, temperature=0.5),
+        _request(SCHEMA, n=2),
+        {**_request(SCHEMA), "model": "other"},
+    ])
+    def test_different_request_misses(self, other):
+        cache = ResponseCache(deterministic_only=False)
+        cache.set(ResponseCache.make_key(_request(SCHEMA)), "v")
+        assert cache.get(ResponseCache.make_key(other)) is None
+
+    def test_only_deterministic_requests_cacheable(self):
+        cache = ResponseCache()
+        assert cache.is_cacheable({"temperature": 0})
+        assert not cache.is_cacheable({"temperature": 0.7})
+        assert ResponseCache(deterministic_only=False).is_cacheable({"temperature": 0.7})
+
+    def test_persisted_after_flush(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = ResponseCache(path)
+        cache.set("k", "v")
+        cache.flush()
+        assert ResponseCache(path).get("k") == "v"
+
+    def test_unflushed_writes_not_persisted(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        ResponseCache(path).set("k", "v")
+        assert ResponseCache(path).get("k") is None
+
+    def test_large_values_stored_compressed(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        value = '{"guesses": []}' * 100
+        cache = ResponseCache(path)
+        cache.set("k", value)
+        cache.flush()
+
+        stored = cache._conn().execute("SELECT value FROM responses").fetchone()[0]
+        assert isinstance(stored, bytes) and len(stored) < len(value)
+        assert ResponseCache(path).get("k") == value
+
+    def test_memory_evicts_least_recently_used(self):
+        cache = ResponseCache(max_memory_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.get("a") == "1"
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ("1", "3")
+
+    def test_evicted_entries_read_back_from_sqlite(self, tmp_path):
+        with ResponseCache(tmp_path / "cache.sqlite", max_memory_entries=1) as cache:
+            cache.set("a", "1")
+            cache.set("b", "2")
+            cache.flush()
+            assert cache.get("a") == "1"
+
+    async def test_close_flushes_and_closes_every_connection(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = ResponseCache(path)
+        # Lookups that miss memory open a connection in a worker thread
+        await cache.aget("missing")
+        await cache.aset("k", "v")
+        conns = list(cache._conns)
+        assert len(conns) == 2
+
+        cache.close()
+        for conn in conns:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        assert ResponseCache(path).get("k") == "v"
+
+
+class TestCompression:
+    def test_short_values_stored_as_text(self):
+        assert cache_module._encode("short") == "short"
+
+    @pytest.mark.parametrize("zstd", [True, False])
+    def test_round_trip(self, monkeypatch, zstd):
+        if not zstd:
+            monkeypatch.setattr(cache_module, "zstandard", None)
+        elif cache_module.zstandard is None:
+            pytest.skip("zstandard not installed")
+        value = '{"word": "CAT\u00e9"}' * 50
+        stored = cache_module._encode(value)
+        assert isinstance(stored, bytes) and len(stored) < len(value)
+        assert stored[:1] == (b"z" if zstd else b"d")
+        assert cache_module._decode(stored) == value
+
+    def test_unreadable_codec_is_a_miss(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache_module, "zstandard", None)
+        path = tmp_path / "cache.sqlite"
+        # A zstd row, as read where zstandard isn't installed
+        ResponseCache(path, compress=False).set_many([("k", b"z\x28\xb5\x2f\xfd")])
+
+        cache = ResponseCache(path)
+        assert cache.get("k") is None
+        assert cache.misses == 1
+
+
+def _status_error(status: int, headers: dict = None) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status, headers=headers, request=request)
+    return openai.APIStatusError("error", response=response, body=None)
+
+
+@pytest.fixture
+def guess_request(game_state):
+    guesser = Guesser(GuesserConfig(), client=FakeClient())
+    clue = Clue(word="FRUIT", number=2, team=Team.RED)
+    return {**guesser.build_request(game_state, clue), "temperature": 0}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Delays requested through asyncio.sleep, which return immediately."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return delays
+
+
+class TestStructuredClient:
+    def test_default_clients_leave_retries_to_structured_client(self, monkeypatch):
+        # SDK retries would multiply attempts and skip the jittered backoff
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        assert Guesser(GuesserConfig()).client.max_retries == 0
+        assert Spymaster(SpymasterConfig()).client.max_retries == 0
+
+    @pytest.mark.parametrize("headers, delay", [
+        ({"retry-after-ms": "250"}, 0.25),
+        ({"retry-after": "3"}, 3.0),
+    ])
+    async def test_retry_after_header_sets_delay(self, sleeps, guess_request, headers, delay):
+        client = FakeClient(errors=[_status_error(429, headers)])
+        llm = StructuredClient(client)
+
+        assert await llm.create_json(guess_request)
+        assert len(client.calls) == 2
+        assert sleeps == [delay]
+        assert llm.retry_counts == {"429": 1}
+
+    async def test_backoff_is_jittered_and_capped(self, sleeps, guess_request):
+        errors = [_status_error(503), openai.APIConnectionError(request=None)] * 2
+        llm = StructuredClient(FakeClient(errors=errors), max_retries=4, max_backoff=2.0)
+
+        assert await llm.create_json(guess_request)
+        assert len(sleeps) == 4
+        assert all(0 <= d <= cap for d, cap in zip(sleeps, [1.0, 2.0, 2.0, 2.0]))
+        assert llm.retry_counts == {"5xx": 2, "connection": 2}
+
+    async def test_client_errors_not_retried(self, sleeps, guess_request):
+        client = FakeClient(errors=[_status_error(400)])
+        with pytest.raises(openai.APIStatusError):
+            await StructuredClient(client).create_json(guess_request)
+        assert len(client.calls) == 1
+        assert sleeps == []
+
+    async def test_gives_up_after_max_retries(self, sleeps, guess_request):
+        client = FakeClient(errors=[_status_error(429)] * 3)
+        with pytest.raises(openai.APIStatusError):
+            await StructuredClient(client, max_retries=2).create_json(guess_request)
+        assert len(client.calls) == 3
+
+    async def test_concurrent_identical_requests_coalesced(self, guess_request):
+        client = FakeClient(latency=0.01)
+        cache = ResponseCache()
+        llm = StructuredClient(client, cache)
+
+        results = await asyncio.gather(*(llm.create_json(guess_request) for _ in range(3)))
+
+        assert len(client.calls) == 1
+        assert len(set(results)) == 1
+        # The waiters shared the in-flight call rather than reading the cache
+        assert (cache.hits, cache.misses) == (0, 3)
+        assert cache.inflight == {}
+
+    async def test_sampled_requests_not_coalesced(self, guess_request):
+        client = FakeClient(latency=0.01)
+        llm = StructuredClient(client, ResponseCache())
+        sampled = {**guess_request, "temperature": 0.7}
+
+        await asyncio.gather(*(llm.create_json(sampled) for _ in range(3)))
+        assert len(client.calls) == 3
+
+    async def test_failed_call_fails_every_waiter(self, guess_request):
+        client = FakeClient(errors=[_status_error(400)], latency=0.01)
+        llm = StructuredClient(client, ResponseCache())
+
+        results = await asyncio.gather(
+            *(llm.create_json(guess_request) for _ in range(2)), return_exceptions=True
+        )
+        assert all(isinstance(r, openai.APIStatusError) for r in results)
+        assert len(client.calls) == 1
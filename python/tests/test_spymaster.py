@@ -0,0 +1,72 @@
+"""Tests for the spymaster."""
+
+import asyncio
+import logging
+
+import pytest
+from src.game import Team
+from src.llm import ResponseCache
+from src.spymaster import CandidateClue, Spymaster, SpymasterConfig
+
+from .fakes import FakeClient
+
+
+def _spymaster(client: FakeClient, **config) -> Spymaster:
+    return Spymaster(
+        SpymasterConfig(candidates_per_turn=6, candidates_per_call=2, **config),
+        client=client,
+        cache=ResponseCache(),
+    )
+
+
+class TestSplitCalls:
+    async def test_all_calls_succeed(self, game_state):
+        output = await _spymaster(FakeClient()).generate_candidates(game_state, Team.RED)
+        assert len(output.candidates) == 6
+        assert output.failed_calls == 0
+
+    async def test_failed_calls_are_counted_and_logged(self, game_state, caplog):
+        client = FakeClient(errors=[RuntimeError("boom")])
+        with caplog.at_level(logging.WARNING, logger="src.spymaster.spymaster"):
+            output = await _spymaster(client).generate_candidates(game_state, Team.RED)
+
+        assert len(output.candidates) == 4
+        assert output.failed_calls == 1
+        assert "1 of 3 spymaster calls failed" in caplog.text
+        assert "boom" in caplog.text
+
+    async def test_every_call_failing_raises(self, game_state):
+        client = FakeClient(errors=[RuntimeError("boom")] * 3)
+        with pytest.raises(RuntimeError, match="boom"):
+            await _spymaster(client).generate_candidates(game_state, Team.RED)
+
+    async def test_cancelled_call_is_not_a_failure(self, game_state):
+        client = FakeClient(errors=[asyncio.CancelledError()])
+        with pytest.raises(asyncio.CancelledError):
+            await _spymaster(client).generate_candidates(game_state, Team.RED)
+
+    async def test_deterministic_calls_not_merged(self, game_state):
+        # Cached, coalesced temperature-0 requests must still be separate calls
+        client = FakeClient(latency=0.01)
+        output = await _spymaster(client, temperature=0).generate_candidates(
+            game_state, Team.RED
+        )
+
+        assert len(client.calls) == 3
+        prompts = {call["messages"][-1]["content"] for call in client.calls}
+        assert len(prompts) == 3
+        assert len({c.clue for c in output.candidates}) == 6
+
+    async def test_repeated_clues_dropped(self, game_state, monkeypatch):
+        spymaster = _spymaster(FakeClient())
+
+        async def request_candidates(request, targets=None):
+            return [
+                CandidateClue(clue=w, number=1, intended_targets=[],
+                              reasoning="", risk_assessment="")
+                for w in ("FRUIT", "fruit")
+            ]
+
+        monkeypatch.setattr(spymaster, "_request_candidates", request_candidates)
+        output = await spymaster.generate_candidates(game_state, Team.RED)
+        assert [c.clue for c in output.candidates] == ["FRUIT"]